@@ -5,17 +5,74 @@ Modern Keyboard Handler
 World-class keyboard input handling for CLI applications.
 """
 
+import os
 import sys
-import termios
-import tty
-import select
-from typing import Optional, Callable, Dict, Any, List
+from types import MappingProxyType
+from typing import Optional, Callable, Dict, Any, List, Mapping
 from enum import Enum
-from dataclasses import dataclass
+from functools import lru_cache
 
+# POSIX terminal modules are only needed once raw mode or a TTY read is
+# requested, so they are imported on first use by _load_terminal_modules().
+termios: Any = None
+tty: Any = None
+select: Any = None
 
-class KeyCode(Enum):
-    """Standard key codes for cross-platform compatibility."""
+
+def _load_terminal_modules() -> None:
+    """Import the terminal control modules on first use."""
+    global termios, tty, select
+    if termios is None:
+        import termios as _termios
+        import tty as _tty
+        import select as _select
+        termios, tty, select = _termios, _tty, _select
+
+
+def _read_char_bytes(fd: int) -> bytes:
+    """
+    Read the bytes of one character from a file descriptor.
+    
+    Pulls in the continuation bytes of a UTF-8 multi-byte character so
+    callers never split a character. os.read already retries on EINTR
+    (PEP 475).
+    """
+    data = os.read(fd, 1)
+    if not data:
+        raise EOFError
+        
+    lead = data[0]
+    if lead >= 0xC0:
+        size = 2 if lead < 0xE0 else 3 if lead < 0xF0 else 4
+        while len(data) < size:
+            chunk = os.read(fd, size - len(data))
+            if not chunk:
+                break
+            data += chunk
+            
+    return data
+
+
+def _read_char(fd: int) -> str:
+    """Read one character from a file descriptor, like sys.stdin.read(1)."""
+    return _read_char_bytes(fd).decode('utf-8', errors='replace')
+
+
+# Trie key marking a node that completes a known escape sequence. It is a
+# string, so it can never collide with a byte (int) edge.
+_SEQ_END = "__end__"
+
+# Upper bound on the bytes consumed for one unrecognized CSI/SS3 sequence.
+_MAX_UNKNOWN_SEQUENCE = 32
+
+
+class KeyCode(str, Enum):
+    """
+    Standard key codes for cross-platform compatibility.
+    
+    Members are strings ("up", "f1", ...), so they can be used directly
+    as binding patterns and dict keys without going through .value.
+    """
     # Navigation
     UP = "up"
     DOWN = "down"
@@ -57,15 +114,150 @@ class KeyCode(Enum):
     UNKNOWN = "unknown"
 
 
-@dataclass
 class KeyPress:
-    """Represents a key press event."""
-    key: KeyCode
-    char: Optional[str] = None
-    ctrl: bool = False
-    alt: bool = False
-    shift: bool = False
-    raw_sequence: str = ""
+    """
+    Represents a key press event.
+    
+    Uses __slots__ instead of a dataclass (slots=True needs Python 3.10+)
+    so each event avoids carrying a per-instance __dict__.
+    """
+    __slots__ = ('key', 'char', 'ctrl', 'alt', 'shift', 'raw_sequence')
+    
+    def __init__(
+        self,
+        key: KeyCode,
+        char: Optional[str] = None,
+        ctrl: bool = False,
+        alt: bool = False,
+        shift: bool = False,
+        raw_sequence: str = ""
+    ):
+        self.key = key
+        self.char = char
+        self.ctrl = ctrl
+        self.alt = alt
+        self.shift = shift
+        self.raw_sequence = raw_sequence
+        
+    def _astuple(self) -> tuple:
+        return (self.key, self.char, self.ctrl, self.alt, self.shift, self.raw_sequence)
+        
+    def __eq__(self, other: object) -> bool:
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        return self._astuple() == other._astuple()  # type: ignore[attr-defined]
+        
+    __hash__ = None  # type: ignore[assignment]  # mutable, like the former dataclass
+        
+    def __repr__(self) -> str:
+        return (
+            f"KeyPress(key={self.key!r}, char={self.char!r}, ctrl={self.ctrl!r}, "
+            f"alt={self.alt!r}, shift={self.shift!r}, raw_sequence={self.raw_sequence!r})"
+        )
+
+
+# Escape sequences are static, so the table (and its trie) is built once at
+# import and shared read-only by every handler instance.
+_KEY_SEQUENCES: Mapping[str, KeyCode] = MappingProxyType({
+    # Arrow keys
+    '\x1b[A': KeyCode.UP,
+    '\x1b[B': KeyCode.DOWN,
+    '\x1b[C': KeyCode.RIGHT,
+    '\x1b[D': KeyCode.LEFT,
+    
+    # Home/End
+    '\x1b[H': KeyCode.HOME,
+    '\x1b[F': KeyCode.END,
+    '\x1b[1~': KeyCode.HOME,
+    '\x1b[4~': KeyCode.END,
+    
+    # Page Up/Down
+    '\x1b[5~': KeyCode.PAGE_UP,
+    '\x1b[6~': KeyCode.PAGE_DOWN,
+    
+    # Delete
+    '\x1b[3~': KeyCode.DELETE,
+    
+    # Function keys
+    '\x1bOP': KeyCode.F1,
+    '\x1bOQ': KeyCode.F2,
+    '\x1bOR': KeyCode.F3,
+    '\x1bOS': KeyCode.F4,
+    '\x1b[15~': KeyCode.F5,
+    '\x1b[17~': KeyCode.F6,
+    '\x1b[18~': KeyCode.F7,
+    '\x1b[19~': KeyCode.F8,
+    '\x1b[20~': KeyCode.F9,
+    '\x1b[21~': KeyCode.F10,
+    '\x1b[23~': KeyCode.F11,
+    '\x1b[24~': KeyCode.F12,
+    
+    # Special sequences
+    '\x1b[Z': KeyCode.TAB,  # Shift+Tab
+})
+
+
+def _build_sequence_trie(sequences: Mapping[str, KeyCode]) -> Dict[Any, Any]:
+    """
+    Build a byte-indexed trie over the escape sequences.
+    
+    Each byte of input advances one node, so unknown sequences are
+    rejected as soon as they leave every known branch.
+    """
+    trie: Dict[Any, Any] = {}
+    for sequence, key_code in sequences.items():
+        node = trie
+        for byte in sequence.encode('ascii'):
+            node = node.setdefault(byte, {})
+        node[_SEQ_END] = key_code
+    return trie
+
+
+_SEQ_TRIE = _build_sequence_trie(_KEY_SEQUENCES)
+
+
+# Control characters with a dedicated key code, indexed by ord() over ASCII.
+# Anything left as None falls through to the Ctrl+letter / unknown handling.
+_CONTROL_KEYS: List[Optional[KeyCode]] = [None] * 128
+_CONTROL_KEYS[ord('\n')] = KeyCode.ENTER
+_CONTROL_KEYS[ord('\r')] = KeyCode.ENTER
+_CONTROL_KEYS[ord('\t')] = KeyCode.TAB
+_CONTROL_KEYS[8] = KeyCode.BACKSPACE  # BS
+_CONTROL_KEYS[127] = KeyCode.BACKSPACE  # DEL
+_CONTROL_KEYS[27] = KeyCode.ESCAPE
+
+# Letter produced by Ctrl+A (1) through Ctrl+Z (26), indexed by ord().
+_CTRL_LETTERS = ('',) + tuple(chr(ord('a') + i) for i in range(26))
+
+# isprintable() answers for ASCII, the bulk of typed and pasted input.
+_ASCII_PRINTABLE = tuple(chr(i).isprintable() for i in range(128))
+
+
+@lru_cache(maxsize=256)
+def _pattern_for(
+    key: str,
+    char: Optional[str],
+    ctrl: bool,
+    alt: bool,
+    shift: bool
+) -> str:
+    """Build the binding pattern for a key press (cached per distinct press)."""
+    parts = []
+    is_unknown = key == KeyCode.UNKNOWN
+    
+    if ctrl:
+        parts.append("ctrl")
+    if alt:
+        parts.append("alt")
+    if shift and not is_unknown:
+        parts.append("shift")
+        
+    if not is_unknown:
+        parts.append(key)
+    elif char:
+        parts.append(char.lower())
+        
+    return "+".join(parts)
 
 
 class KeyboardHandler:
@@ -81,53 +273,21 @@ class KeyboardHandler:
     def __init__(self):
         """Initialize keyboard handler."""
         self.key_bindings: Dict[str, Callable] = {}
-        self.key_sequences = self._build_key_sequences()
+        self.key_sequences = _KEY_SEQUENCES
+        self._seq_trie = _SEQ_TRIE
         self._original_settings: Optional[List] = None
         self._raw_mode_active = False
+        # stdin does not switch between TTY and pipe during a run, so check once
+        self._is_tty = sys.stdin.isatty()
         
-    def _build_key_sequences(self) -> Dict[str, KeyCode]:
-        """Build mapping of escape sequences to key codes."""
-        return {
-            # Arrow keys
-            '\x1b[A': KeyCode.UP,
-            '\x1b[B': KeyCode.DOWN,
-            '\x1b[C': KeyCode.RIGHT,
-            '\x1b[D': KeyCode.LEFT,
-            
-            # Home/End
-            '\x1b[H': KeyCode.HOME,
-            '\x1b[F': KeyCode.END,
-            '\x1b[1~': KeyCode.HOME,
-            '\x1b[4~': KeyCode.END,
-            
-            # Page Up/Down
-            '\x1b[5~': KeyCode.PAGE_UP,
-            '\x1b[6~': KeyCode.PAGE_DOWN,
-            
-            # Delete
-            '\x1b[3~': KeyCode.DELETE,
-            
-            # Function keys
-            '\x1bOP': KeyCode.F1,
-            '\x1bOQ': KeyCode.F2,
-            '\x1bOR': KeyCode.F3,
-            '\x1bOS': KeyCode.F4,
-            '\x1b[15~': KeyCode.F5,
-            '\x1b[17~': KeyCode.F6,
-            '\x1b[18~': KeyCode.F7,
-            '\x1b[19~': KeyCode.F8,
-            '\x1b[20~': KeyCode.F9,
-            '\x1b[21~': KeyCode.F10,
-            '\x1b[23~': KeyCode.F11,
-            '\x1b[24~': KeyCode.F12,
-            
-            # Special sequences
-            '\x1b[Z': KeyCode.TAB,  # Shift+Tab
-        }
+    def _build_key_sequences(self) -> Mapping[str, KeyCode]:
+        """Return the shared mapping of escape sequences to key codes."""
+        return _KEY_SEQUENCES
         
     def enter_raw_mode(self) -> None:
         """Enter raw terminal mode for character-by-character input."""
-        if sys.stdin.isatty() and not self._raw_mode_active:
+        if self._is_tty and not self._raw_mode_active:
+            _load_terminal_modules()
             self._original_settings = termios.tcgetattr(sys.stdin.fileno())
             tty.setraw(sys.stdin.fileno())
             self._raw_mode_active = True
@@ -135,6 +295,7 @@ class KeyboardHandler:
     def exit_raw_mode(self) -> None:
         """Exit raw terminal mode."""
         if self._original_settings and self._raw_mode_active:
+            _load_terminal_modules()
             termios.tcsetattr(sys.stdin.fileno(), termios.TCSADRAIN, self._original_settings)
             self._raw_mode_active = False
             self._original_settings = None
@@ -149,7 +310,7 @@ class KeyboardHandler:
         Returns:
             KeyPress object or None if timeout
         """
-        if not sys.stdin.isatty():
+        if not self._is_tty:
             # Fallback for non-interactive terminals
             try:
                 char = sys.stdin.read(1)
@@ -157,40 +318,73 @@ class KeyboardHandler:
             except:
                 return None
                 
+        _load_terminal_modules()
+        
+        # Bind hot lookups to locals for the escape-sequence loop below
+        stdin = sys.stdin
+        read = _read_char
+        read_bytes = _read_char_bytes
+        poll = select.select
+        readers = [stdin]
+        
         # Check if input is available
         if timeout is not None:
-            ready, _, _ = select.select([sys.stdin], [], [], timeout)
+            ready, _, _ = poll(readers, [], [], timeout)
             if not ready:
                 return None
                 
         try:
+            # Read straight from the descriptor: this skips the text-io layer
+            # and keeps select() honest, since nothing is left buffered in
+            # sys.stdin that the descriptor would not report as ready
+            fd = stdin.fileno()
+            
             # Read first character
-            char = sys.stdin.read(1)
+            char = read(fd)
             
             # Handle escape sequences
             if char == '\x1b':
-                sequence = char
+                # Collect raw bytes and decode once, instead of growing a str
+                buffer = bytearray(b'\x1b')
+                node = self._seq_trie[0x1b]
                 
                 # Read additional characters for escape sequences
                 for _ in range(10):  # Max sequence length
-                    if select.select([sys.stdin], [], [], 0.1)[0]:
-                        next_char = sys.stdin.read(1)
-                        sequence += next_char
+                    if poll(readers, [], [], 0.1)[0]:
+                        data = read_bytes(fd)
+                        buffer += data
                         
+                        # Stop as soon as no known sequence can match
+                        # (multi-byte characters never appear in one)
+                        node = node.get(data[0]) if len(data) == 1 else None
+                        if node is None:
+                            # Inside an unknown CSI/SS3 sequence (e.g. Ctrl+Up,
+                            # ESC [ 1 ; 5 A), consume it through its final byte
+                            # so the tail is not read back as separate keys
+                            if len(buffer) > 2 and buffer[1] in b'[O' and len(data) == 1:
+                                while (not 0x40 <= buffer[-1] <= 0x7E
+                                       and len(buffer) < _MAX_UNKNOWN_SEQUENCE
+                                       and poll(readers, [], [], 0.1)[0]):
+                                    buffer += read_bytes(fd)
+                            break
+                            
                         # Check if we have a complete sequence
-                        if sequence in self.key_sequences:
+                        if _SEQ_END in node:
                             return KeyPress(
-                                key=self.key_sequences[sequence],
-                                raw_sequence=sequence
+                                key=node[_SEQ_END],
+                                raw_sequence=buffer.decode('ascii')
                             )
                     else:
                         break
                         
                 # If no sequence matched, it's just escape
-                if sequence == '\x1b':
-                    return KeyPress(key=KeyCode.ESCAPE, raw_sequence=sequence)
+                if len(buffer) == 1:
+                    return KeyPress(key=KeyCode.ESCAPE, raw_sequence=char)
                 else:
-                    return KeyPress(key=KeyCode.UNKNOWN, raw_sequence=sequence)
+                    return KeyPress(
+                        key=KeyCode.UNKNOWN,
+                        raw_sequence=buffer.decode('utf-8', errors='replace')
+                    )
                     
             return self._parse_key(char)
             
@@ -199,14 +393,18 @@ class KeyboardHandler:
             
     def _parse_key(self, char: str) -> KeyPress:
         """Parse a single character into a KeyPress."""
+        ord_char = ord(char)
+        
         # Control characters
-        if ord(char) < 32:
+        if ord_char < 32:
             return self._parse_control_char(char)
             
-        # Regular characters
+        # Regular characters (ASCII answered from a table, not a Unicode lookup)
+        printable = _ASCII_PRINTABLE[ord_char] if ord_char < 128 else char.isprintable()
+        
         if char == ' ':
             return KeyPress(key=KeyCode.SPACE, char=char)
-        elif char.isprintable():
+        elif printable:
             return KeyPress(
                 key=KeyCode.UNKNOWN,
                 char=char,
@@ -218,20 +416,14 @@ class KeyboardHandler:
     def _parse_control_char(self, char: str) -> KeyPress:
         """Parse control characters."""
         ord_char = ord(char)
+        key_code = _CONTROL_KEYS[ord_char] if ord_char < 128 else None
         
-        if ord_char == 10 or ord_char == 13:  # \n or \r
-            return KeyPress(key=KeyCode.ENTER)
-        elif ord_char == 9:  # \t
-            return KeyPress(key=KeyCode.TAB)
-        elif ord_char == 127 or ord_char == 8:  # DEL or BS
-            return KeyPress(key=KeyCode.BACKSPACE)
-        elif ord_char == 27:  # ESC
-            return KeyPress(key=KeyCode.ESCAPE)
+        if key_code is not None:
+            return KeyPress(key=key_code)
         elif 1 <= ord_char <= 26:  # Ctrl+A through Ctrl+Z
-            ctrl_char = chr(ord('a') + ord_char - 1)
             return KeyPress(
                 key=KeyCode.UNKNOWN,
-                char=ctrl_char,
+                char=_CTRL_LETTERS[ord_char],
                 ctrl=True
             )
         else:
@@ -245,7 +437,25 @@ class KeyboardHandler:
             key_pattern: Key pattern (e.g., "q", "ctrl+c", "up", "f1")
             callback: Function to call when key is pressed
         """
-        self.key_bindings[key_pattern.lower()] = callback
+        # islower() is a cheap check that saves allocating a lowered copy
+        # for the common, already-lowercase pattern
+        if not key_pattern.islower():
+            key_pattern = key_pattern.lower()
+        self.key_bindings[key_pattern] = callback
+        
+    def bind_keys(self, bindings: Dict[str, Callable[[KeyPress], Any]]) -> None:
+        """
+        Bind several key patterns at once.
+        
+        Args:
+            bindings: Mapping of key patterns to callbacks, as for bind_key
+        """
+        self.key_bindings.update(
+            {
+                key_pattern if key_pattern.islower() else key_pattern.lower(): callback
+                for key_pattern, callback in bindings.items()
+            }
+        )
         
     def handle_key(self, key_press: KeyPress) -> bool:
         """
@@ -259,41 +469,38 @@ class KeyboardHandler:
         """
         # Try exact key match first
         key_pattern = self._key_press_to_pattern(key_press)
+        callback = self.key_bindings.get(key_pattern)
         
-        if key_pattern in self.key_bindings:
-            self.key_bindings[key_pattern](key_press)
-            return True
-            
-        # Try character match for printable characters
-        if key_press.char and key_press.char.lower() in self.key_bindings:
-            self.key_bindings[key_press.char.lower()](key_press)
-            return True
+        # Fall back to a character match for printable characters, unless
+        # the character is the pattern we already probed
+        if callback is None and key_press.char:
+            char_pattern = key_press.char
+            if not char_pattern.islower():
+                char_pattern = char_pattern.lower()
+            if char_pattern != key_pattern:
+                callback = self.key_bindings.get(char_pattern)
+                
+        if callback is None:
+            return False
             
-        return False
+        callback(key_press)
+        return True
         
     def _key_press_to_pattern(self, key_press: KeyPress) -> str:
         """Convert a KeyPress to a pattern string."""
-        parts = []
-        
-        if key_press.ctrl:
-            parts.append("ctrl")
-        if key_press.alt:
-            parts.append("alt")
-        if key_press.shift and key_press.key != KeyCode.UNKNOWN:
-            parts.append("shift")
-            
-        if key_press.key != KeyCode.UNKNOWN:
-            parts.append(key_press.key.value)
-        elif key_press.char:
-            parts.append(key_press.char.lower())
-            
-        return "+".join(parts)
+        return _pattern_for(
+            key_press.key,
+            key_press.char,
+            key_press.ctrl,
+            key_press.alt,
+            key_press.shift
+        )
         
     def create_input_loop(
         self,
         prompt: str = "",
         quit_keys: Optional[List[str]] = None
-    ) -> Callable:
+    ) -> "InputLoop":
         """
         Create an input loop context manager.
         
@@ -307,41 +514,7 @@ class KeyboardHandler:
         if quit_keys is None:
             quit_keys = ["q", "ctrl+c", "escape"]
             
-        class InputLoop:
-            def __init__(self, handler: KeyboardHandler):
-                self.handler = handler
-                self.running = False
-                
-            def __enter__(self):
-                self.handler.enter_raw_mode()
-                self.running = True
-                if prompt:
-                    print(prompt, end='', flush=True)
-                return self
-                
-            def __exit__(self, exc_type, exc_val, exc_tb):
-                self.handler.exit_raw_mode()
-                self.running = False
-                
-            def run(self) -> Optional[KeyPress]:
-                """Run one iteration of the input loop."""
-                if not self.running:
-                    return None
-                    
-                key_press = self.handler.read_key(timeout=0.1)
-                if key_press:
-                    # Check for quit keys
-                    pattern = self.handler._key_press_to_pattern(key_press)
-                    if pattern in quit_keys or (key_press.char and key_press.char.lower() in quit_keys):
-                        self.running = False
-                        return None
-                        
-                    # Handle key bindings
-                    self.handler.handle_key(key_press)
-                    
-                return key_press
-                
-        return InputLoop(self)
+        return InputLoop(self, prompt, quit_keys)
         
     def wait_for_key(self, valid_keys: Optional[List[str]] = None) -> KeyPress:
         """
@@ -378,6 +551,52 @@ class KeyboardHandler:
         self.exit_raw_mode()
 
 
+class InputLoop:
+    """
+    Input loop context manager returned by KeyboardHandler.create_input_loop.
+    
+    Defined once at module level (rather than per call) with __slots__,
+    so opening a prompt only allocates a small instance.
+    """
+    __slots__ = ('handler', 'prompt', 'quit_keys', 'running')
+    
+    def __init__(self, handler: KeyboardHandler, prompt: str, quit_keys: List[str]):
+        self.handler = handler
+        self.prompt = prompt
+        self.quit_keys = quit_keys
+        self.running = False
+        
+    def __enter__(self):
+        self.handler.enter_raw_mode()
+        self.running = True
+        if self.prompt:
+            print(self.prompt, end='', flush=True)
+        return self
+        
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.handler.exit_raw_mode()
+        self.running = False
+        
+    def run(self) -> Optional[KeyPress]:
+        """Run one iteration of the input loop."""
+        if not self.running:
+            return None
+            
+        key_press = self.handler.read_key(timeout=0.1)
+        if key_press:
+            # Check for quit keys
+            quit_keys = self.quit_keys
+            pattern = self.handler._key_press_to_pattern(key_press)
+            if pattern in quit_keys or (key_press.char and key_press.char.lower() in quit_keys):
+                self.running = False
+                return None
+                
+            # Handle key bindings
+            self.handler.handle_key(key_press)
+            
+        return key_press
+
+
 # Convenience functions
 def wait_for_any_key(prompt: str = "Press any key to continue...") -> KeyPress:
     """Wait for any key press."""
@@ -6,6 +6,7 @@ Beautiful slideshow renderer with header layout and navigation.
 """
 
 import os
+import re
 import sys
 from typing import List, Optional, Dict, Tuple
 from dataclasses import dataclass
@@ -18,6 +19,9 @@ from storm_checker.cli.colors import THEME, PALETTE, RESET, BOLD, CLEAR_SCREEN,
 from storm_checker.cli.components.border import Border, BorderStyle
 from storm_checker.cli.components.progress_bar import ProgressBar
 
+# Matches ANSI escape sequences (colors, cursor control)
+_ANSI_ESCAPE = re.compile(r'\x1B(?:[@-Z\\-_]|\[[0-?]*[ -/]*[@-~])')
+
 
 class ContentMode(Enum):
     """Content display modes for tutorial slideshow."""
@@ -412,9 +416,7 @@ class Slideshow:
         
     def _strip_ansi(self, text: str) -> str:
         """Strip ANSI codes from text."""
-        import re
-        ansi_escape = re.compile(r'\x1B(?:[@-Z\\-_]|\[[0-?]*[ -/]*[@-~])')
-        return ansi_escape.sub('', text)
+        return _ANSI_ESCAPE.sub('', text)
         
     def render_completion_screen(
         self,
@@ -449,9 +451,9 @@ class Slideshow:
         lines.append(
             self.border.middle(
                 self.width, 
-                left=f"{THEME['success']}{left}{RESET}",
-                center=f"{BOLD}{THEME['success']}{center}{RESET}",
-                right=f"{THEME['success']}{right}{RESET}"
+                left_text=f"{THEME['success']}{left}{RESET}",
+                center_text=f"{BOLD}{THEME['success']}{center}{RESET}",
+                right_text=f"{THEME['success']}{right}{RESET}"
             )
         )
         lines.append(self.border.horizontal_divider(self.width))
@@ -8,7 +8,7 @@ Handles tutorial display without logic concerns.
 import sys
 import re
 from pathlib import Path
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Optional, List, NamedTuple, Tuple
 
 # Add parent directory to path for imports
 sys.path.insert(0, str(Path(__file__).parent.parent.parent))
@@ -18,6 +18,38 @@ from storm_checker.cli.components.border import Border, BorderStyle
 from storm_checker.cli.components.progress_bar import ProgressBar
 from storm_checker.logic.tutorial_engine import TutorialState
 
+# Matches ANSI escape sequences (colors, cursor control)
+_ANSI_ESCAPE = re.compile(r'\x1B(?:[@-Z\\-_]|\[[0-?]*[ -/]*[@-~])')
+
+# Characters that make a content line need markdown formatting; numbered
+# list lines are detected separately, with the parser's own digit test.
+_MARKDOWN_MARKERS = ('#', '`', '*', '-', '•')
+
+# Inline markdown rules, applied in order to each content line.
+_INLINE_MARKDOWN = (
+    # **text** -> bold
+    (re.compile(r'\*\*(.*?)\*\*'), f'{BOLD}\\1{RESET}'),
+    # *text* -> underline (true italics aren't widely supported); the
+    # lookarounds keep it from matching **bold** markers
+    (re.compile(r'(?<!\*)\*([^*]+?)\*(?!\*)'), f'\033[4m\\1{RESET}'),
+    # `text` -> code styling
+    (re.compile(r'`([^`]+?)`'), f'{THEME["info"]}\\1{RESET}'),
+)
+
+# Footer navigation hints, indexed by whether the slide has a question.
+_NAV_HINTS = (
+    f"{THEME['info']}[Enter: Next | b: Back | q: Quit]{RESET}",
+    f"{THEME['warning']}[Enter: Knowledge Check | b: Back | q: Quit]{RESET}",
+)
+
+
+class _Chrome(NamedTuple):
+    """Border lines that depend only on the render width."""
+    top: str
+    divider: str
+    empty: str
+    bottom: str
+
 
 class TutorialRenderer:
     """Pure tutorial rendering component."""
@@ -39,6 +71,14 @@ class TutorialRenderer:
             color_filled="success",
             color_empty="text_muted"
         )
+        # Formatted slide content keyed on (content, width), reused on redraws
+        self._content_cache: Dict[Tuple[str, int], Tuple[str, ...]] = {}
+        # Rich console for code blocks, built on first use and then reused
+        self._code_console: Optional[Any] = None
+        # Width _code_console was built with (Console.width queries the terminal)
+        self._code_console_width: Optional[int] = None
+        # Width-only border lines keyed on width
+        self._chrome_cache: Dict[int, _Chrome] = {}
         
     def _get_terminal_width(self) -> int:
         """Get terminal width with fallback."""
@@ -84,14 +124,14 @@ class TutorialRenderer:
             
         # Question prompt if needed
         if show_question_prompt and page_data['has_question']:
-            lines.append(self.border.empty_line(self.width))
+            lines.append(self._chrome().empty)
             lines.append(self.border.middle(
                 self.width,
                 center_text=f"{THEME['warning']}📝 Press Enter for Knowledge Check{RESET}"
             ))
             
         # Add minimal spacing
-        lines.append(self.border.empty_line(self.width))
+        lines.append(self._chrome().empty)
         
         # Footer
         footer_lines = self._render_footer(
@@ -126,7 +166,7 @@ class TutorialRenderer:
             self.width,
             left_text=f"  {THEME['warning']}📝 Knowledge Check!{RESET}"
         ))
-        lines.append(self.border.empty_line(self.width))
+        lines.append(self._chrome().empty)
         
         # Question content inside borders
         if question_content:
@@ -147,12 +187,12 @@ class TutorialRenderer:
                         lines.append(self.border.middle(self.width, left_text=f"  {line}"))
                 else:
                     # Empty lines for spacing
-                    lines.append(self.border.empty_line(self.width))
+                    lines.append(self._chrome().empty)
         else:
             # Fallback for when no content is provided
             lines.append(self.border.middle(self.width, center_text=""))
         
-        lines.append(self.border.empty_line(self.width))
+        lines.append(self._chrome().empty)
         
         # Footer
         footer_lines = self._render_footer(
@@ -193,7 +233,7 @@ class TutorialRenderer:
                 self.width,
                 left_text=f"  {THEME['error']}❌ Not quite right.{RESET}"
             ))
-            lines.append(self.border.empty_line(self.width))
+            lines.append(self._chrome().empty)
             lines.append(self.border.middle(
                 self.width,
                 left_text=f"  The correct answer is: {result_data['correct_option']}"
@@ -201,39 +241,17 @@ class TutorialRenderer:
             
         # Explanation if available
         if result_data.get('explanation'):
-            lines.append(self.border.empty_line(self.width))
+            lines.append(self._chrome().empty)
             lines.append(self.border.middle(
                 self.width,
                 left_text=f"  {THEME['info']}📖 Explanation:{RESET}"
             ))
             # Format explanation - wrap long lines
-            explanation = result_data['explanation']
             max_width = self.width - 6  # Account for borders and padding
-            
-            # Simple word wrapping
-            words = explanation.split()
-            current_line = []
-            current_length = 0
-            
-            for word in words:
-                word_length = len(word)
-                if current_length + word_length + len(current_line) > max_width:
-                    # Wrap to next line
-                    if current_line:
-                        line_text = " ".join(current_line)
-                        lines.append(self.border.middle(self.width, left_text=f"  {line_text}"))
-                        current_line = [word]
-                        current_length = word_length
-                else:
-                    current_line.append(word)
-                    current_length += word_length
-            
-            # Add remaining words
-            if current_line:
-                line_text = " ".join(current_line)
+            for line_text in self._wrap_text(result_data['explanation'], max_width):
                 lines.append(self.border.middle(self.width, left_text=f"  {line_text}"))
                     
-        lines.append(self.border.empty_line(self.width))
+        lines.append(self._chrome().empty)
         
         # Footer
         footer_lines = self._render_footer(
@@ -250,20 +268,20 @@ class TutorialRenderer:
         lines = [CLEAR_SCREEN]
         
         # Header
-        lines.append(self.border.top(self.width))
+        lines.append(self._chrome().top)
         lines.append(self.border.middle(
             self.width,
             left_text=f" TUTORIAL: {completion_data['tutorial_id']}",
             center_text=f"🎉 Tutorial Complete! 🎉",
             right_text="Finished "
         ))
-        lines.append(self.border.horizontal_divider(self.width))
+        lines.append(self._chrome().divider)
         
         # Score
         score_correct, score_total = completion_data['score']
         score_pct = completion_data['score_percentage']
         
-        lines.append(self.border.empty_line(self.width))
+        lines.append(self._chrome().empty)
         lines.append(self.border.middle(
             self.width,
             center_text=f"Score: {score_correct}/{score_total} ({score_pct:.0f}%)"
@@ -278,7 +296,7 @@ class TutorialRenderer:
             grade_msg = f"{THEME['warning']}Keep practicing! You might want to review this tutorial again.{RESET}"
             
         lines.append(self.border.middle(self.width, center_text=grade_msg))
-        lines.append(self.border.empty_line(self.width))
+        lines.append(self._chrome().empty)
         
         # Related errors if available
         if completion_data.get('related_errors'):
@@ -289,10 +307,10 @@ class TutorialRenderer:
             for error in completion_data['related_errors'][:3]:  # Show top 3
                 lines.append(self.border.middle(self.width, center_text=f"  • {error}"))
                 
-        lines.append(self.border.empty_line(self.width))
+        lines.append(self._chrome().empty)
         
         # Footer
-        lines.append(self.border.horizontal_divider(self.width))
+        lines.append(self._chrome().divider)
         lines.append(self.border.middle(
             self.width,
             center_text=f"{THEME['info']}Press any key to exit...{RESET}"
@@ -301,7 +319,7 @@ class TutorialRenderer:
             self.width,
             center_text=f"{THEME['info']}Run 'stormcheck tutorial {completion_data['tutorial_id']}' to try again!{RESET}"
         ))
-        lines.append(self.border.bottom(self.width))
+        lines.append(self._chrome().bottom)
         
         return "\n".join(lines)
         
@@ -309,14 +327,14 @@ class TutorialRenderer:
         """Render slideshow header."""
         lines = []
         
-        lines.append(self.border.top(self.width))
+        lines.append(self._chrome().top)
         
         left = f" TUTORIAL: {tutorial_id}"
         if is_completed:
             left = f" ✅ {left}"
             
         lines.append(self.border.middle(self.width, left_text=left, center_text=title, right_text=f"Page {page_info} "))
-        lines.append(self.border.horizontal_divider(self.width))
+        lines.append(self._chrome().divider)
         
         return lines
         
@@ -324,7 +342,7 @@ class TutorialRenderer:
         """Render slideshow footer."""
         lines = []
         
-        lines.append(self.border.horizontal_divider(self.width))
+        lines.append(self._chrome().divider)
         
         # Progress bar
         progress_text = self.progress_bar.render(current_page, total_pages, label="Progress")
@@ -332,13 +350,26 @@ class TutorialRenderer:
         
         # Navigation hints
         lines.append(self.border.middle(self.width, center_text=nav_hints))
-        lines.append(self.border.bottom(self.width))
+        lines.append(self._chrome().bottom)
         
         return lines
         
     def _format_content(self, content: str) -> list:
-        """Format content for display."""
+        """Format content for display, reusing the result for repeat renders."""
+        key = (content, self.width)
+        cached = self._content_cache.get(key)
+        if cached is None:
+            cached = self._content_cache[key] = tuple(self._parse_content(content))
+        return list(cached)
+        
+    def _parse_content(self, content: str) -> list:
+        """Parse markdown-style content into formatted display lines."""
         lines = content.split('\n')
+        
+        # Plain text: no marker any formatting rule below would act on
+        if not any(marker in content for marker in _MARKDOWN_MARKERS) \
+                and not any(line[:3].replace('.', '').strip().isdigit() for line in lines):
+            return [line if line.strip() else "" for line in lines]
         formatted_lines = []
         in_code_block = False
         code_language = None
@@ -401,18 +432,12 @@ class TutorialRenderer:
         
     def _process_inline_markdown(self, line: str) -> str:
         """Process inline markdown formatting like **bold**, *italic*, and `code`."""
-        import re
-        
-        # Handle bold text: **text** -> bold formatting
-        line = re.sub(r'\*\*(.*?)\*\*', f'{BOLD}\\1{RESET}', line)
-        
-        # Handle italic text: *text* -> underline (since true italics aren't widely supported)
-        # Use negative lookahead/lookbehind to avoid matching **bold** patterns
-        line = re.sub(r'(?<!\*)\*([^*]+?)\*(?!\*)', f'\033[4m\\1{RESET}', line)
-        
-        # Handle inline code: `text` -> code styling
-        line = re.sub(r'`([^`]+?)`', f'{THEME["info"]}\\1{RESET}', line)
+        # Plain lines (the common case) have no markers to process
+        if '*' not in line and '`' not in line:
+            return line
         
+        for pattern, replacement in _INLINE_MARKDOWN:
+            line = pattern.sub(replacement, line)
         return line
         
     def _format_code_block(self, code_lines: List[str], language: str) -> List[str]:
@@ -436,8 +461,11 @@ class TutorialRenderer:
                 code_width=self.width - 10  # Account for borders and padding
             )
             
-            # Render to string
-            console = Console(width=self.width - 6, legacy_windows=False)
+            # Render to string, reusing the console while the width holds
+            console = self._code_console
+            if console is None or self._code_console_width != self.width - 6:
+                console = self._code_console = Console(width=self.width - 6, legacy_windows=False)
+                self._code_console_width = self.width - 6
             with console.capture() as capture:
                 console.print(syntax, highlight=True)
             
@@ -497,44 +525,47 @@ class TutorialRenderer:
                 
         return formatted_lines
         
+    def _chrome(self) -> _Chrome:
+        """Width-only border lines, drawn once per width and then reused."""
+        chrome = self._chrome_cache.get(self.width)
+        if chrome is None:
+            chrome = self._chrome_cache[self.width] = _Chrome(
+                self.border.top(self.width),
+                self.border.horizontal_divider(self.width),
+                self.border.empty_line(self.width),
+                self.border.bottom(self.width),
+            )
+        return chrome
+        
     def _get_navigation_hints(self, has_question: bool) -> str:
         """Get navigation hints based on context."""
-        if has_question:
-            return f"{THEME['warning']}[Enter: Knowledge Check | b: Back | q: Quit]{RESET}"
-        else:
-            return f"{THEME['info']}[Enter: Next | b: Back | q: Quit]{RESET}"
+        return _NAV_HINTS[bool(has_question)]
     
     def _strip_ansi(self, text: str) -> str:
         """Remove ANSI escape sequences from text."""
-        import re
-        ansi_escape = re.compile(r'\x1B(?:[@-Z\\-_]|\[[0-?]*[ -/]*[@-~])')
-        return ansi_escape.sub('', text)
+        return _ANSI_ESCAPE.sub('', text)
     
     def _wrap_text(self, text: str, max_width: int) -> List[str]:
         """Wrap text to fit within max_width, preserving ANSI codes."""
-        # For now, simple word-based wrapping
-        words = text.split()
         lines = []
         current_line = []
-        current_length = 0
-        
-        for word in words:
-            word_length = len(self._strip_ansi(word))
-            if current_length + word_length + len(current_line) > max_width:
-                if current_line:
-                    lines.append(' '.join(current_line))
-                    current_line = [word]
-                    current_length = word_length
-                else:
-                    # Word is too long, force break
-                    lines.append(word)
-                    current_line = []
-                    current_length = 0
-            else:
+        current_width = 0  # Visible width of current_line, spaces included
+        
+        for word in text.split():
+            word_width = len(_ANSI_ESCAPE.sub('', word))
+            needed = current_width + 1 + word_width if current_line else word_width
+            if needed <= max_width:
                 current_line.append(word)
-                current_length += word_length
+                current_width = needed
+            elif current_line:
+                lines.append(' '.join(current_line))
+                current_line = [word]
+                current_width = word_width
+            else:
+                # Word is too long, force break
+                lines.append(word)
         
         if current_line:
             lines.append(' '.join(current_line))
             
-        return lines
\ No newline at end of file
+        return lines
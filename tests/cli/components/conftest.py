@@ -0,0 +1,160 @@
+"""
+Component Test Fixtures
+=======================
+Shared mocks for the Rich terminal component tests.
+"""
+
+import importlib
+import sys
+from unittest.mock import Mock, MagicMock, create_autospec
+
+import pytest
+
+
+@pytest.fixture(scope="session")
+def rt_module():
+    """The rich_terminal module, resolved once for attribute patching."""
+    return importlib.import_module('storm_checker.cli.components.rich_terminal')
+
+
+@pytest.fixture(scope="session")
+def _spec_br():
+    """Autospecced BufferedRenderer instance, introspected once per session."""
+    from storm_checker.cli.components.buffered_renderer import BufferedRenderer
+    return create_autospec(BufferedRenderer, instance=True)
+
+
+@pytest.fixture(scope="session")
+def capture_stub():
+    """Factory for console.capture() context managers yielding fixed output."""
+    def make(output="out"):
+        capture = Mock()
+        capture.get.return_value = output
+        context = MagicMock()
+        context.__enter__.return_value = capture
+        context.__exit__.return_value = False
+        return context
+    return make
+
+
+# The fixtures below patch rich_terminal itself, so they stay class-scoped:
+# each test class gets its own patch lifetime and nothing leaks into the
+# next class or module.
+
+@pytest.fixture(scope="class", name="rich_term_mock_br")
+def fixture_rich_term_mock_br(request, rt_module, _spec_br):
+    """Install the spec'd BufferedRenderer mock for the whole class."""
+    _spec_br.reset_mock()
+    _spec_br.terminal_width = 80
+
+    mp = pytest.MonkeyPatch()
+    request.addfinalizer(mp.undo)
+    mp.setattr(rt_module, "BufferedRenderer", Mock(return_value=_spec_br))
+    return _spec_br
+
+
+@pytest.fixture(scope="class")
+def mock_rich_imports(request, capture_stub, rt_module):
+    """Mock Rich library imports for the whole class."""
+    # Create a mock console instance with all methods pre-configured
+    mock_console_instance = Mock()
+
+    # Set up capture() to return a proper context manager
+    mock_console_instance.capture = Mock(return_value=capture_stub("test output\nline 2"))
+
+    # Set up print method
+    mock_console_instance.print = Mock()
+
+    # Set up status() context manager
+    mock_status_context = MagicMock()
+    mock_status_context.__enter__.return_value = mock_status_context
+    mock_status_context.__exit__.return_value = False
+    mock_console_instance.status = Mock(return_value=mock_status_context)
+
+    # Mock the Console class to return our instance
+    mp = pytest.MonkeyPatch()
+    request.addfinalizer(mp.undo)
+    mp.setattr(rt_module, "RICH_AVAILABLE", True)
+    mp.setattr(rt_module, "Console", Mock(return_value=mock_console_instance))
+    return mock_console_instance
+
+
+@pytest.fixture(scope="class")
+def rich_stubs(request, rt_module):
+    """Replace every Rich renderable/prompt class used by RichTerminal."""
+    stubs = {
+        name: MagicMock()
+        for name in ("Panel", "Table", "Markdown", "Syntax", "Rule", "Tree",
+                     "Prompt", "Confirm", "Progress", "Live")
+    }
+    mp = pytest.MonkeyPatch()
+    request.addfinalizer(mp.undo)
+    for name, stub in stubs.items():
+        mp.setattr(rt_module, name, stub)
+    return stubs
+
+
+# Fake Rich package installed by mock_rich: each submodule and the classes
+# rich_terminal imports from it.
+_RICH_MOCKS = {
+    'rich': [],
+    'rich.console': ['Console', 'ConsoleOptions', 'RenderResult'],
+    'rich.text': ['Text'],
+    'rich.panel': ['Panel'],
+    'rich.table': ['Table'],
+    'rich.progress': ['Progress', 'TaskID', 'BarColumn', 'TextColumn',
+                      'TimeRemainingColumn', 'SpinnerColumn'],
+    'rich.layout': ['Layout'],
+    'rich.live': ['Live'],
+    'rich.markdown': ['Markdown'],
+    'rich.syntax': ['Syntax'],
+    'rich.rule': ['Rule'],
+    'rich.prompt': ['Prompt', 'Confirm'],
+    'rich.align': ['Align'],
+    'rich.padding': ['Padding'],
+    'rich.columns': ['Columns'],
+    'rich.tree': ['Tree'],
+}
+
+# Submodules whose classes are used as context managers (Console.capture,
+# Progress, Live) or mocked prompts; everything else only needs attribute
+# access, so a plain Mock is enough.
+_MAGIC_RICH_MOCKS = frozenset({'rich.console', 'rich.progress', 'rich.live', 'rich.prompt'})
+
+
+@pytest.fixture(scope="session")
+def rich_module_names():
+    """Names of the Rich modules rich_terminal imports, for targeted cleanup."""
+    return tuple(_RICH_MOCKS)
+
+
+@pytest.fixture(scope="module")
+def mock_rich(request, rt_module):
+    """Swap a fake Rich package in for one test module, then restore it.
+
+    Each fake submodule goes into sys.modules and its classes onto
+    rich_terminal's globals; both are undone when the module finishes, so
+    the fakes never reach tests in other modules.
+    """
+    mp = pytest.MonkeyPatch()
+    request.addfinalizer(mp.undo)
+    fakes = {}
+    for mod, attrs in _RICH_MOCKS.items():
+        mock_class = MagicMock if mod in _MAGIC_RICH_MOCKS else Mock
+        module_mock = mock_class()
+        for attr in attrs:
+            setattr(module_mock, attr, mock_class())
+            mp.setattr(rt_module, attr, getattr(module_mock, attr), raising=False)
+        mp.setitem(sys.modules, mod, module_mock)
+        fakes[mod] = module_mock
+    mp.setattr(rt_module, "RICH_AVAILABLE", True)
+
+    # Console instance whose capture() context yields fixed output
+    console = fakes['rich.console'].Console.return_value
+    console.capture.return_value.__enter__.return_value.get.return_value = "mocked output"
+    console.capture.return_value.__exit__.return_value = False
+
+    # Prompt components answer without reading stdin
+    fakes['rich.prompt'].Prompt.ask.return_value = "mocked_input"
+    fakes['rich.prompt'].Confirm.ask.return_value = True
+    return fakes
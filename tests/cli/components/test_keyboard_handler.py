@@ -4,18 +4,27 @@ Comprehensive Tests for Keyboard Handler
 Tests for keyboard input handling with full coverage of all functionality.
 """
 
+import importlib
 import pytest
 import sys
+from collections.abc import Mapping
 from unittest.mock import Mock, patch, MagicMock, mock_open
 from io import StringIO
+from types import SimpleNamespace
 
 from storm_checker.cli.components.keyboard_handler import (
-    KeyCode, KeyPress, KeyboardHandler,
+    KeyCode, KeyPress, KeyboardHandler, InputLoop,
     wait_for_any_key, wait_for_specific_key, create_navigation_handler,
-    demo_keyboard_handler
+    demo_keyboard_handler, _SEQ_END, _pattern_for, _load_terminal_modules
 )
 
 
+@pytest.fixture(autouse=True)
+def terminal_modules():
+    """Load the lazily imported terminal modules so tests can patch them."""
+    _load_terminal_modules()
+
+
 class TestKeyCode:
     """Test the KeyCode enum."""
     
@@ -62,6 +71,13 @@ class TestKeyCode:
         
         for key in expected_keys:
             assert hasattr(KeyCode, key), f"KeyCode missing {key}"
+    
+    def test_keycode_is_str_subclass(self):
+        """Test KeyCode members are usable as plain strings."""
+        assert isinstance(KeyCode.UP, str)
+        assert KeyCode.UP == "up"
+        assert {"up": 1}[KeyCode.UP] == 1
+        assert type(_pattern_for(KeyCode.UP, None, False, False, False)) is str
 
 
 class TestKeyPress:
@@ -95,6 +111,21 @@ class TestKeyPress:
         assert key_press.alt is True
         assert key_press.shift is True
         assert key_press.raw_sequence == '\x1b[A'
+    
+    def test_keypress_uses_slots(self):
+        """Test KeyPress instances have no per-instance __dict__."""
+        key_press = KeyPress(key=KeyCode.ENTER)
+        
+        assert not hasattr(key_press, '__dict__')
+        with pytest.raises(AttributeError):
+            key_press.extra = True
+    
+    def test_keypress_equality_and_repr(self):
+        """Test KeyPress compares by value and has a readable repr."""
+        assert KeyPress(key=KeyCode.UP, raw_sequence='\x1b[A') == KeyPress(key=KeyCode.UP, raw_sequence='\x1b[A')
+        assert KeyPress(key=KeyCode.UP) != KeyPress(key=KeyCode.DOWN)
+        assert KeyPress(key=KeyCode.UP) != "up"
+        assert repr(KeyPress(key=KeyCode.ENTER)).startswith("KeyPress(key=<KeyCode.ENTER")
 
 
 class TestKeyboardHandler:
@@ -105,12 +136,18 @@ class TestKeyboardHandler:
         """Create KeyboardHandler instance for testing."""
         return KeyboardHandler()
     
+    @pytest.fixture
+    def stdin_fd(self):
+        """Give stdin a file descriptor so TTY reads can reach os.read."""
+        with patch('storm_checker.cli.components.keyboard_handler.sys.stdin.fileno', return_value=0):
+            yield 0
+    
     def test_keyboard_handler_initialization(self, handler):
         """Test that the KeyboardHandler can be initialized."""
         assert isinstance(handler, KeyboardHandler)
         assert isinstance(handler.key_bindings, dict)
         assert len(handler.key_bindings) == 0
-        assert isinstance(handler.key_sequences, dict)
+        assert isinstance(handler.key_sequences, Mapping)
         assert len(handler.key_sequences) > 0
         assert handler._original_settings is None
         assert handler._raw_mode_active is False
@@ -133,13 +170,21 @@ class TestKeyboardHandler:
         assert sequences['\x1b[B'] == KeyCode.DOWN
         assert sequences['\x1bOP'] == KeyCode.F1
     
-    @patch('storm_checker.cli.components.keyboard_handler.sys.stdin.isatty')
+    def test_key_sequences_shared_instance(self):
+        """Test that handlers share one read-only key sequence table."""
+        first, second = KeyboardHandler(), KeyboardHandler()
+        
+        assert first.key_sequences is second.key_sequences
+        assert first._build_key_sequences() is first.key_sequences
+        with pytest.raises(TypeError):
+            first.key_sequences['\x1b[A'] = KeyCode.DOWN
+    
     @patch('storm_checker.cli.components.keyboard_handler.termios.tcgetattr')
     @patch('storm_checker.cli.components.keyboard_handler.tty.setraw')
     @patch('storm_checker.cli.components.keyboard_handler.sys.stdin.fileno')
-    def test_enter_raw_mode(self, mock_fileno, mock_setraw, mock_tcgetattr, mock_isatty, handler):
+    def test_enter_raw_mode(self, mock_fileno, mock_setraw, mock_tcgetattr, handler):
         """Test entering raw terminal mode."""
-        mock_isatty.return_value = True
+        handler._is_tty = True
         mock_fileno.return_value = 0
         mock_tcgetattr.return_value = ['original', 'settings']
         
@@ -150,25 +195,38 @@ class TestKeyboardHandler:
         mock_tcgetattr.assert_called_once_with(0)
         mock_setraw.assert_called_once_with(0)
     
-    @patch('storm_checker.cli.components.keyboard_handler.sys.stdin.isatty')
-    def test_enter_raw_mode_not_tty(self, mock_isatty, handler):
+    def test_enter_raw_mode_not_tty(self, handler):
         """Test entering raw mode when not a TTY."""
-        mock_isatty.return_value = False
+        handler._is_tty = False
         
         handler.enter_raw_mode()
         
         assert handler._raw_mode_active is False
         assert handler._original_settings is None
     
+    def test_isatty_cached_at_construction(self):
+        """Test that the TTY check happens once, when the handler is built."""
+        with patch('storm_checker.cli.components.keyboard_handler.sys.stdin') as mock_stdin:
+            mock_stdin.isatty.return_value = False
+            mock_stdin.read.return_value = 'a'
+            handler = KeyboardHandler()
+            
+            handler.read_key()
+            handler.read_key()
+            
+        assert handler._is_tty is False
+        mock_stdin.isatty.assert_called_once_with()
+    
     def test_enter_raw_mode_already_active(self, handler):
         """Test entering raw mode when already active."""
         handler._raw_mode_active = True
         handler._original_settings = ['old', 'settings']
         
-        with patch('storm_checker.cli.components.keyboard_handler.sys.stdin.isatty', return_value=True):
-            with patch('storm_checker.cli.components.keyboard_handler.termios.tcgetattr') as mock_tcgetattr:
-                handler.enter_raw_mode()
-                mock_tcgetattr.assert_not_called()
+        handler._is_tty = True
+        
+        with patch('storm_checker.cli.components.keyboard_handler.termios.tcgetattr') as mock_tcgetattr:
+            handler.enter_raw_mode()
+            mock_tcgetattr.assert_not_called()
     
     @patch('storm_checker.cli.components.keyboard_handler.termios.tcsetattr')
     @patch('storm_checker.cli.components.keyboard_handler.sys.stdin.fileno')
@@ -190,11 +248,10 @@ class TestKeyboardHandler:
             handler.exit_raw_mode()
             mock_tcsetattr.assert_not_called()
     
-    @patch('storm_checker.cli.components.keyboard_handler.sys.stdin.isatty')
     @patch('storm_checker.cli.components.keyboard_handler.sys.stdin.read')
-    def test_read_key_non_tty(self, mock_read, mock_isatty, handler):
+    def test_read_key_non_tty(self, mock_read, handler):
         """Test reading key from non-TTY terminal."""
-        mock_isatty.return_value = False
+        handler._is_tty = False
         mock_read.return_value = 'a'
         
         key_press = handler.read_key()
@@ -203,22 +260,20 @@ class TestKeyboardHandler:
         assert key_press.char == 'a'
         mock_read.assert_called_once_with(1)
     
-    @patch('storm_checker.cli.components.keyboard_handler.sys.stdin.isatty')
     @patch('storm_checker.cli.components.keyboard_handler.sys.stdin.read')
-    def test_read_key_non_tty_exception(self, mock_read, mock_isatty, handler):
+    def test_read_key_non_tty_exception(self, mock_read, handler):
         """Test reading key from non-TTY with exception."""
-        mock_isatty.return_value = False
+        handler._is_tty = False
         mock_read.side_effect = Exception("Read error")
         
         key_press = handler.read_key()
         
         assert key_press is None
     
-    @patch('storm_checker.cli.components.keyboard_handler.sys.stdin.isatty')
     @patch('storm_checker.cli.components.keyboard_handler.select.select')
-    def test_read_key_timeout(self, mock_select, mock_isatty, handler):
+    def test_read_key_timeout(self, mock_select, handler):
         """Test reading key with timeout."""
-        mock_isatty.return_value = True
+        handler._is_tty = True
         mock_select.return_value = ([], [], [])  # No input ready
         
         key_press = handler.read_key(timeout=0.1)
@@ -226,14 +281,13 @@ class TestKeyboardHandler:
         assert key_press is None
         mock_select.assert_called_once_with([sys.stdin], [], [], 0.1)
     
-    @patch('storm_checker.cli.components.keyboard_handler.sys.stdin.isatty')
     @patch('storm_checker.cli.components.keyboard_handler.select.select')
-    @patch('storm_checker.cli.components.keyboard_handler.sys.stdin.read')
-    def test_read_key_simple_char(self, mock_read, mock_select, mock_isatty, handler):
+    @patch('storm_checker.cli.components.keyboard_handler.os.read')
+    def test_read_key_simple_char(self, mock_read, mock_select, handler, stdin_fd):
         """Test reading a simple character."""
-        mock_isatty.return_value = True
+        handler._is_tty = True
         mock_select.return_value = ([sys.stdin], [], [])  # Input ready
-        mock_read.return_value = 'a'
+        mock_read.return_value = b'a'
         
         key_press = handler.read_key()
         
@@ -241,19 +295,42 @@ class TestKeyboardHandler:
         assert key_press.char == 'a'
         assert key_press.key == KeyCode.UNKNOWN
     
-    @patch('storm_checker.cli.components.keyboard_handler.sys.stdin.isatty')
+    @patch('storm_checker.cli.components.keyboard_handler.select.select')
+    @patch('storm_checker.cli.components.keyboard_handler.os.read')
+    def test_read_key_blocking_no_select(self, mock_read, mock_select, handler, stdin_fd):
+        """Test that a blocking read goes straight to stdin without polling."""
+        handler._is_tty = True
+        mock_read.return_value = b'a'
+        
+        key_press = handler.read_key(timeout=None)
+        
+        assert key_press.char == 'a'
+        mock_select.assert_not_called()
+    
     @patch('storm_checker.cli.components.keyboard_handler.select.select')
     @patch('storm_checker.cli.components.keyboard_handler.sys.stdin.read')
-    def test_read_key_escape_sequence(self, mock_read, mock_select, mock_isatty, handler):
+    def test_read_key_non_tty_no_select(self, mock_read, mock_select, handler):
+        """Test that non-TTY input never touches select, even with a timeout."""
+        handler._is_tty = False
+        mock_read.return_value = 'a'
+        
+        key_press = handler.read_key(timeout=0.1)
+        
+        assert key_press.char == 'a'
+        mock_select.assert_not_called()
+    
+    @patch('storm_checker.cli.components.keyboard_handler.select.select')
+    @patch('storm_checker.cli.components.keyboard_handler.os.read')
+    def test_read_key_escape_sequence(self, mock_read, mock_select, handler, stdin_fd):
         """Test reading escape sequence."""
-        mock_isatty.return_value = True
+        handler._is_tty = True
         mock_select.side_effect = [
             ([sys.stdin], [], []),  # Initial select
             ([sys.stdin], [], []),  # First sequence char
             ([sys.stdin], [], []),  # Second sequence char
             ([], [], [])            # No more chars
         ]
-        mock_read.side_effect = ['\x1b', '[', 'A']  # UP arrow sequence
+        mock_read.side_effect = [b'\x1b', b'[', b'A']  # UP arrow sequence
         
         key_press = handler.read_key()
         
@@ -261,18 +338,17 @@ class TestKeyboardHandler:
         assert key_press.key == KeyCode.UP
         assert key_press.raw_sequence == '\x1b[A'
     
-    @patch('storm_checker.cli.components.keyboard_handler.sys.stdin.isatty')
     @patch('storm_checker.cli.components.keyboard_handler.select.select')
-    @patch('storm_checker.cli.components.keyboard_handler.sys.stdin.read')
-    def test_read_key_escape_only(self, mock_read, mock_select, mock_isatty, handler):
+    @patch('storm_checker.cli.components.keyboard_handler.os.read')
+    def test_read_key_escape_only(self, mock_read, mock_select, handler, stdin_fd):
         """Test reading lone escape character."""
-        mock_isatty.return_value = True
+        handler._is_tty = True
         
         # All select calls should timeout (no input available for sequence continuation)
         mock_select.return_value = ([], [], [])  # Always return no input available
         
         # Only return escape once for the main read
-        mock_read.return_value = '\x1b'
+        mock_read.return_value = b'\x1b'
         
         key_press = handler.read_key()
         
@@ -280,12 +356,11 @@ class TestKeyboardHandler:
         assert key_press.key == KeyCode.ESCAPE
         assert key_press.raw_sequence == '\x1b'
     
-    @patch('storm_checker.cli.components.keyboard_handler.sys.stdin.isatty')
     @patch('storm_checker.cli.components.keyboard_handler.select.select')
-    @patch('storm_checker.cli.components.keyboard_handler.sys.stdin.read')
-    def test_read_key_unknown_sequence(self, mock_read, mock_select, mock_isatty, handler):
+    @patch('storm_checker.cli.components.keyboard_handler.os.read')
+    def test_read_key_unknown_sequence(self, mock_read, mock_select, handler, stdin_fd):
         """Test reading unknown escape sequence."""
-        mock_isatty.return_value = True
+        handler._is_tty = True
         
         # First select shows input available, then no more input
         mock_select.side_effect = [
@@ -294,7 +369,7 @@ class TestKeyboardHandler:
         ]
         
         # Mock reading escape then X - need to account for the initial read + loop read
-        mock_read.side_effect = ['\x1b', 'X']
+        mock_read.side_effect = [b'\x1b', b'X']
         
         key_press = handler.read_key()
         
@@ -302,11 +377,60 @@ class TestKeyboardHandler:
         assert key_press.key == KeyCode.UNKNOWN
         assert key_press.raw_sequence == '\x1bX'
     
-    @patch('storm_checker.cli.components.keyboard_handler.sys.stdin.isatty')
-    @patch('storm_checker.cli.components.keyboard_handler.sys.stdin.read')
-    def test_read_key_keyboard_interrupt(self, mock_read, mock_isatty, handler):
+    @patch('storm_checker.cli.components.keyboard_handler.select.select')
+    @patch('storm_checker.cli.components.keyboard_handler.os.read')
+    def test_seq_trie_early_terminates_on_unknown(self, mock_read, mock_select, handler, stdin_fd):
+        """Test that no further reads happen once a sequence leaves the trie."""
+        handler._is_tty = True
+        mock_select.return_value = ([sys.stdin], [], [])  # Input always ready
+        mock_read.side_effect = [b'\x1b', b'X', b'Y', b'Z']
+        
+        key_press = handler.read_key()
+        
+        assert key_press.key == KeyCode.UNKNOWN
+        assert key_press.raw_sequence == '\x1bX'
+        assert mock_read.call_count == 2
+    
+    @patch('storm_checker.cli.components.keyboard_handler.select.select')
+    @patch('storm_checker.cli.components.keyboard_handler.os.read')
+    def test_read_key_unknown_csi_sequence_read_whole(self, mock_read, mock_select, handler, stdin_fd):
+        """Test that an unknown CSI sequence (Ctrl+Up) is consumed through its final byte."""
+        handler._is_tty = True
+        mock_select.return_value = ([sys.stdin], [], [])
+        mock_read.side_effect = [b'\x1b', b'[', b'1', b';', b'5', b'A', b'x']
+        
+        key_press = handler.read_key()
+        
+        assert key_press.key == KeyCode.UNKNOWN
+        assert key_press.raw_sequence == '\x1b[1;5A'
+        assert mock_read.call_count == 6
+    
+    @patch('storm_checker.cli.components.keyboard_handler.select.select')
+    @patch('storm_checker.cli.components.keyboard_handler.os.read')
+    def test_read_key_escape_then_multibyte_char(self, mock_read, mock_select, handler, stdin_fd):
+        """Test a multi-byte character after ESC is read whole and ends the sequence."""
+        handler._is_tty = True
+        mock_select.return_value = ([sys.stdin], [], [])
+        mock_read.side_effect = [b'\x1b', b'\xc3', b'\xa9']  # ESC, then e-acute
+        
+        key_press = handler.read_key()
+        
+        assert key_press.key == KeyCode.UNKNOWN
+        assert key_press.raw_sequence == '\x1b\u00e9'
+        assert mock_read.call_count == 3
+    
+    def test_seq_trie_matches_key_sequences(self, handler):
+        """Test that every key sequence terminates at its key code in the trie."""
+        for sequence, key_code in handler.key_sequences.items():
+            node = handler._seq_trie
+            for byte in sequence.encode('ascii'):
+                node = node[byte]
+            assert node[_SEQ_END] == key_code
+    
+    @patch('storm_checker.cli.components.keyboard_handler.os.read')
+    def test_read_key_keyboard_interrupt(self, mock_read, handler, stdin_fd):
         """Test handling KeyboardInterrupt."""
-        mock_isatty.return_value = True
+        handler._is_tty = True
         mock_read.side_effect = KeyboardInterrupt
         
         key_press = handler.read_key()
@@ -315,11 +439,10 @@ class TestKeyboardHandler:
         assert key_press.key == KeyCode.ESCAPE
         assert key_press.ctrl is True
     
-    @patch('storm_checker.cli.components.keyboard_handler.sys.stdin.isatty')
-    @patch('storm_checker.cli.components.keyboard_handler.sys.stdin.read')
-    def test_read_key_eof_error(self, mock_read, mock_isatty, handler):
+    @patch('storm_checker.cli.components.keyboard_handler.os.read')
+    def test_read_key_eof_error(self, mock_read, handler, stdin_fd):
         """Test handling EOFError."""
-        mock_isatty.return_value = True
+        handler._is_tty = True
         mock_read.side_effect = EOFError
         
         key_press = handler.read_key()
@@ -328,6 +451,38 @@ class TestKeyboardHandler:
         assert key_press.key == KeyCode.ESCAPE
         assert key_press.ctrl is True
     
+    @patch('storm_checker.cli.components.keyboard_handler.os.read')
+    def test_read_key_end_of_input(self, mock_read, handler, stdin_fd):
+        """Test that an empty os.read (closed input) is treated like EOFError."""
+        handler._is_tty = True
+        mock_read.return_value = b''
+        
+        key_press = handler.read_key()
+        
+        assert key_press.key == KeyCode.ESCAPE
+        assert key_press.ctrl is True
+    
+    @patch('storm_checker.cli.components.keyboard_handler.os.read')
+    def test_read_key_utf8_multibyte(self, mock_read, handler, stdin_fd):
+        """Test that UTF-8 continuation bytes are read into one character."""
+        handler._is_tty = True
+        mock_read.side_effect = [b'\xe2', b'\x82', b'\xac']  # Euro sign
+        
+        key_press = handler.read_key()
+        
+        assert key_press.char == '\u20ac'
+        mock_read.assert_called_with(0, 1)
+    
+    @patch('storm_checker.cli.components.keyboard_handler.os.read')
+    def test_read_key_truncated_utf8(self, mock_read, handler, stdin_fd):
+        """Test that a truncated UTF-8 character decodes to a replacement."""
+        handler._is_tty = True
+        mock_read.side_effect = [b'\xc3', b'']
+        
+        key_press = handler.read_key()
+        
+        assert key_press.char == '\ufffd'
+    
     def test_parse_key_control_char(self, handler):
         """Test parsing control characters."""
         # Enter
@@ -407,12 +562,26 @@ class TestKeyboardHandler:
         assert key_press.char == 'z'
         assert key_press.ctrl is True
     
+    def test_parse_control_char_all_ctrl_letters(self, handler):
+        """Test every Ctrl+letter without its own key code maps to its letter."""
+        # Ctrl+H, Ctrl+I, Ctrl+J and Ctrl+M arrive as BS, TAB, LF and CR
+        for offset in set(range(26)) - {7, 8, 9, 12}:
+            key_press = handler._parse_control_char(chr(offset + 1))
+            assert key_press.char == chr(ord('a') + offset)
+            assert key_press.ctrl is True
+    
     def test_parse_control_char_unknown(self, handler):
         """Test parsing unknown control character."""
         key_press = handler._parse_control_char('\x00')
         assert key_press.key == KeyCode.UNKNOWN
         assert key_press.raw_sequence == '\x00'
     
+    def test_parse_control_char_outside_ascii_table(self, handler):
+        """Test characters beyond the ASCII jump table parse as unknown."""
+        key_press = handler._parse_control_char('\x9b')
+        assert key_press.key == KeyCode.UNKNOWN
+        assert key_press.raw_sequence == '\x9b'
+    
     def test_parse_control_char_backspace_direct(self, handler):
         """Test parsing control backspace character directly (line 227)."""
         # Test BS (8) directly through _parse_control_char to hit line 227
@@ -447,6 +616,24 @@ class TestKeyboardHandler:
         
         assert "q" in handler.key_bindings
     
+    def test_bind_key_lowercase_pattern_kept_as_is(self, handler):
+        """Test already-lowercase and caseless patterns bind unchanged."""
+        handler.bind_key("ctrl+c", Mock())
+        handler.bind_key("1", Mock())
+        handler.bind_key("F1", Mock())
+        
+        assert set(handler.key_bindings) == {"ctrl+c", "1", "f1"}
+    
+    def test_bind_keys_bulk(self, handler):
+        """Test binding many keys at once lowercases every pattern."""
+        callbacks = {f"Ctrl+{chr(ord('A') + i % 26)}{i}": Mock() for i in range(50)}
+        
+        handler.bind_keys(callbacks)
+        
+        assert len(handler.key_bindings) == 50
+        for pattern, callback in callbacks.items():
+            assert handler.key_bindings[pattern.lower()] is callback
+    
     def test_handle_key_exact_match(self, handler):
         """Test handling key with exact pattern match."""
         callback = Mock()
@@ -500,18 +687,17 @@ class TestKeyboardHandler:
         assert result is True
         callback.assert_called_once_with(key_press)
     
-    @patch('storm_checker.cli.components.keyboard_handler.sys.stdin.isatty')
     @patch('storm_checker.cli.components.keyboard_handler.select.select')
-    @patch('storm_checker.cli.components.keyboard_handler.sys.stdin.read')
-    def test_read_key_escape_sequence_timeout_covers_line_191(self, mock_read, mock_select, mock_isatty, handler):
+    @patch('storm_checker.cli.components.keyboard_handler.os.read')
+    def test_read_key_escape_sequence_timeout_covers_line_191(self, mock_read, mock_select, handler, stdin_fd):
         """Test escape sequence timeout to cover line 191."""
-        mock_isatty.return_value = True
+        handler._is_tty = True
         
         # Mock select: first call has input (the initial escape), all subsequent calls timeout
         mock_select.side_effect = [([], [], [])] * 11  # All selects timeout - no input
         
         # Mock a single escape character read
-        mock_read.return_value = '\x1b'
+        mock_read.return_value = b'\x1b'
         
         key_press = handler.read_key()
         
@@ -548,6 +734,32 @@ class TestKeyboardHandler:
         assert result is True
         callback.assert_called_once_with(key_press)
     
+    def test_handle_key_single_dict_probe(self, handler):
+        """Test that dispatch probes the bindings once per key press."""
+        class CountingDict(dict):
+            probes = 0
+            
+            def get(self, key, default=None):
+                CountingDict.probes += 1
+                return super().get(key, default)
+        
+        callback = Mock()
+        handler.key_bindings = CountingDict(a=callback)
+        
+        # Bound character: one probe
+        assert handler.handle_key(KeyPress(key=KeyCode.UNKNOWN, char='A')) is True
+        assert CountingDict.probes == 1
+        
+        # Unbound character: pattern equals the char, so no second probe
+        CountingDict.probes = 0
+        assert handler.handle_key(KeyPress(key=KeyCode.UNKNOWN, char='z')) is False
+        assert CountingDict.probes == 1
+        
+        # Modified character: falls back to the bare char
+        CountingDict.probes = 0
+        assert handler.handle_key(KeyPress(key=KeyCode.UNKNOWN, char='a', ctrl=True)) is True
+        assert CountingDict.probes == 2
+    
     def test_key_press_to_pattern_simple(self, handler):
         """Test converting simple key press to pattern."""
         key_press = KeyPress(key=KeyCode.ENTER)
@@ -583,6 +795,17 @@ class TestKeyboardHandler:
         
         assert pattern == "a"  # shift not included for UNKNOWN keys
     
+    def test_key_press_to_pattern_is_cached(self, handler):
+        """Test that repeated identical key presses reuse the cached pattern."""
+        _pattern_for.cache_clear()
+        key_press = KeyPress(key=KeyCode.UNKNOWN, char='c', ctrl=True)
+        
+        first = handler._key_press_to_pattern(key_press)
+        second = handler._key_press_to_pattern(key_press)
+        
+        assert first == second == "ctrl+c"
+        assert _pattern_for.cache_info().hits >= 1
+    
     def test_create_input_loop_default_quit_keys(self, handler):
         """Test creating input loop with default quit keys."""
         loop_instance = handler.create_input_loop()
@@ -603,6 +826,16 @@ class TestKeyboardHandler:
         assert hasattr(loop_instance, '__enter__')
         assert hasattr(loop_instance, '__exit__')
     
+    def test_create_input_loop_reuses_class(self, handler):
+        """Test input loops share one slotted class instead of a class per call."""
+        first = handler.create_input_loop()
+        second = handler.create_input_loop(prompt="> ", quit_keys=["x"])
+        
+        assert type(first) is type(second) is InputLoop
+        assert not hasattr(first, '__dict__')
+        assert first.quit_keys == ["q", "ctrl+c", "escape"]
+        assert second.quit_keys == ["x"]
+    
     def test_input_loop_context_manager(self, handler):
         """Test input loop as context manager."""
         with patch.object(handler, 'enter_raw_mode') as mock_enter:
@@ -719,12 +952,24 @@ class TestKeyboardHandler:
 class TestConvenienceFunctions:
     """Test convenience functions."""
     
-    @patch('storm_checker.cli.components.keyboard_handler.KeyboardHandler')
+    @pytest.fixture(scope="class")
+    def handler_spec(self):
+        """KeyboardHandler attribute names, computed once for every spec'd mock."""
+        return dir(KeyboardHandler)
+    
+    @pytest.fixture
+    def mock_handler(self, handler_spec, monkeypatch):
+        """Install a fresh spec'd handler mock as the module's KeyboardHandler."""
+        handler = Mock(spec=handler_spec)
+        monkeypatch.setattr(
+            'storm_checker.cli.components.keyboard_handler.KeyboardHandler',
+            lambda: handler
+        )
+        return handler
+    
     @patch('builtins.print')
-    def test_wait_for_any_key_default_prompt(self, mock_print, mock_handler_class):
+    def test_wait_for_any_key_default_prompt(self, mock_print, mock_handler):
         """Test wait_for_any_key with default prompt."""
-        mock_handler = Mock()
-        mock_handler_class.return_value = mock_handler
         mock_key = KeyPress(key=KeyCode.ENTER)
         mock_handler.wait_for_key.return_value = mock_key
         
@@ -735,26 +980,25 @@ class TestConvenienceFunctions:
         mock_print.assert_any_call()  # Newline
         mock_handler.wait_for_key.assert_called_once_with()
     
-    @patch('storm_checker.cli.components.keyboard_handler.KeyboardHandler')
     @patch('builtins.print')
-    def test_wait_for_any_key_custom_prompt(self, mock_print, mock_handler_class):
+    def test_wait_for_any_key_custom_prompt(self, mock_print, monkeypatch):
         """Test wait_for_any_key with custom prompt."""
-        mock_handler = Mock()
-        mock_handler_class.return_value = mock_handler
         mock_key = KeyPress(key=KeyCode.ENTER)
-        mock_handler.wait_for_key.return_value = mock_key
+        # No call verification needed, so a plain stub beats a Mock
+        stub_handler = SimpleNamespace(wait_for_key=lambda *args: mock_key)
+        monkeypatch.setattr(
+            'storm_checker.cli.components.keyboard_handler.KeyboardHandler',
+            lambda: stub_handler
+        )
         
         result = wait_for_any_key("Custom prompt: ")
         
         assert result == mock_key
         mock_print.assert_any_call("Custom prompt: ", end='', flush=True)
     
-    @patch('storm_checker.cli.components.keyboard_handler.KeyboardHandler')
     @patch('builtins.print')
-    def test_wait_for_specific_key(self, mock_print, mock_handler_class):
+    def test_wait_for_specific_key(self, mock_print, mock_handler):
         """Test wait_for_specific_key function."""
-        mock_handler = Mock()
-        mock_handler_class.return_value = mock_handler
         mock_key = KeyPress(key=KeyCode.UNKNOWN, char='y')
         mock_handler.wait_for_key.return_value = mock_key
         
@@ -764,11 +1008,8 @@ class TestConvenienceFunctions:
         mock_print.assert_any_call("Continue? (y/n)", end='', flush=True)
         mock_handler.wait_for_key.assert_called_once_with(['y', 'n'])
     
-    @patch('storm_checker.cli.components.keyboard_handler.KeyboardHandler')
-    def test_create_navigation_handler(self, mock_handler_class):
+    def test_create_navigation_handler(self, mock_handler):
         """Test create_navigation_handler function."""
-        mock_handler = Mock()
-        mock_handler_class.return_value = mock_handler
         
         result = create_navigation_handler()
         
@@ -777,17 +1018,12 @@ class TestConvenienceFunctions:
         assert mock_handler.bind_key.call_count == 3
         
         # Check that keys were bound
-        bound_keys = [call[0][0] for call in mock_handler.bind_key.call_args_list]
-        assert "q" in bound_keys
-        assert "h" in bound_keys
-        assert "ctrl+c" in bound_keys
+        bound_keys = frozenset(call.args[0] for call in mock_handler.bind_key.call_args_list)
+        assert {"q", "h", "ctrl+c"} <= bound_keys
     
-    @patch('storm_checker.cli.components.keyboard_handler.KeyboardHandler')
     @patch('builtins.print')
-    def test_demo_keyboard_handler(self, mock_print, mock_handler_class):
+    def test_demo_keyboard_handler(self, mock_print, mock_handler):
         """Test demo_keyboard_handler function."""
-        mock_handler = Mock()
-        mock_handler_class.return_value = mock_handler
         
         # Mock the input loop - use MagicMock for context manager
         mock_loop = MagicMock()
@@ -816,12 +1052,9 @@ class TestConvenienceFunctions:
         # Should create input loop
         mock_handler.create_input_loop.assert_called_once()
     
-    @patch('storm_checker.cli.components.keyboard_handler.KeyboardHandler')
     @patch('builtins.print')
-    def test_demo_keyboard_handler_unhandled_key(self, mock_print, mock_handler_class):
+    def test_demo_keyboard_handler_unhandled_key(self, mock_print, mock_handler):
         """Test demo with unhandled key press."""
-        mock_handler = Mock()
-        mock_handler_class.return_value = mock_handler
         
         # Mock the input loop - use MagicMock for context manager
         mock_loop = MagicMock()
@@ -851,21 +1084,43 @@ class TestConvenienceFunctions:
         mock_print.assert_any_call("  [with Shift]")
 
 
+class TestTerminalModuleLoading:
+    """Test the lazy import of termios, tty and select."""
+    
+    def test_import_leaves_terminal_modules_unloaded(self, monkeypatch):
+        """Test that a fresh import of keyboard_handler does not load the modules."""
+        import storm_checker.cli.components as components
+        from storm_checker.cli.components import keyboard_handler
+        
+        monkeypatch.delitem(sys.modules, keyboard_handler.__name__)
+        # The fresh import rebinds the package attribute; have monkeypatch restore it
+        monkeypatch.setattr(components, 'keyboard_handler', keyboard_handler)
+        
+        fresh = importlib.import_module(keyboard_handler.__name__)
+        
+        assert (fresh.termios, fresh.tty, fresh.select) == (None, None, None)
+    
+    def test_terminal_modules_loaded_on_first_use(self, monkeypatch):
+        """Test that terminal modules are imported on first use, then reused."""
+        from storm_checker.cli.components import keyboard_handler
+        
+        for module_name in ('termios', 'tty', 'select'):
+            monkeypatch.setattr(keyboard_handler, module_name, None)
+        
+        _load_terminal_modules()
+        loaded = keyboard_handler.termios
+        
+        assert loaded is not None
+        assert keyboard_handler.tty is not None
+        assert keyboard_handler.select is not None
+        
+        _load_terminal_modules()
+        assert keyboard_handler.termios is loaded
+
+
 class TestMainExecution:
     """Test main execution path."""
     
-    @patch('storm_checker.cli.components.keyboard_handler.demo_keyboard_handler')
-    def test_main_execution(self, mock_demo):
-        """Test that demo runs when module executed as main."""
-        # Simulate running as main module
-        import sys
-        original_name = sys.modules['cli.components.keyboard_handler'].__name__ if 'cli.components.keyboard_handler' in sys.modules else None
-        
-        try:
-            # This test would require actually running the module as __main__
-            # which is complex to test. We'll just verify the demo function exists
-            # and would be callable
-            assert callable(demo_keyboard_handler)
-        finally:
-            if original_name:
-                sys.modules['cli.components.keyboard_handler'].__name__ = original_name
+    def test_main_execution(self):
+        """Test that the demo run by the __main__ block is callable."""
+        assert callable(demo_keyboard_handler)
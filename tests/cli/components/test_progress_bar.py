@@ -5,6 +5,7 @@ Test progress bar rendering and functionality.
 """
 
 import pytest
+import re
 import sys
 import time
 from pathlib import Path
@@ -12,10 +13,40 @@ from pathlib import Path
 # Add parent directory to path
 sys.path.insert(0, str(Path(__file__).parent.parent.parent.parent))
 
-from storm_checker.cli.components.progress_bar import ProgressBar, SpinnerBar
+from storm_checker.cli.components.progress_bar import ProgressBar, SpinnerBar, demo
 from storm_checker.cli.colors import THEME, PALETTE, RESET
 
+# Strips ANSI escape codes from rendered output
+_ANSI_ESCAPE = re.compile(r'\x1B(?:[@-Z\\-_]|\[[0-?]*[ -/]*[@-~])')
 
+
+# Section headings and samples that demo() must print
+_DEMO_EXPECTED_OUTPUT = (
+    "Storm-Checker Progress Bar Demo",
+    "Basic Progress Bars:",
+    "blocks",
+    "dots",
+    "arrows",
+    "squares",
+    "lines",
+    "Animated Progress:",
+    "Loading",
+    "Segmented Progress Bar:",
+    "Tutorial Progress",
+    "Spinners:",
+    "Custom Colors:",
+)
+
+
+@pytest.fixture(autouse=True, scope="module")
+def _no_sleep():
+    """Make time.sleep a no-op once for the whole module (demo() animates)."""
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(time, "sleep", lambda *_: None)
+        yield
+
+
+@pytest.mark.xdist_group(name="progress_bar")
 class TestProgressBar:
     """Test ProgressBar class functionality."""
     
@@ -145,18 +176,14 @@ class TestProgressBar:
         assert "█" in result or "▏" in result  # Filled or partial blocks
         assert "░" in result  # Empty blocks
         
-    @pytest.mark.parametrize("progress,total,expected_pct", [
-        (0, 100, "0%"),
-        (25, 100, "25%"),
-        (50, 100, "50%"),
-        (75, 100, "75%"),
-        (100, 100, "100%"),
-    ])
-    def test_various_progress_levels(self, progress, total, expected_pct):
+    def test_various_progress_levels(self):
         """Test various progress levels."""
         bar = ProgressBar()
-        result = bar.render(progress, total)
-        assert expected_pct in result
+        levels = (0, 25, 50, 75, 100)
+        results = [bar.render(progress, 100) for progress in levels]
+        
+        missing = [p for p, result in zip(levels, results) if f"{p}%" not in result]
+        assert not missing, f"percentages missing from render: {missing}"
         
     def test_invalid_style_fallback(self):
         """Test fallback for invalid style."""
@@ -180,10 +207,12 @@ def test_animated_progress():
     bar = ProgressBar(show_percentage=True)
     
     # Simulate progress animation
-    for i in range(0, 101, 20):
-        result = bar.render(i, 100, label="Processing")
-        assert f"{i}%" in result
-        assert "Processing" in result
+    levels = range(0, 101, 20)
+    results = [bar.render(i, 100, label="Processing") for i in levels]
+    
+    missing = [i for i, result in zip(levels, results)
+               if f"{i}%" not in result or "Processing" not in result]
+    assert not missing, f"frames missing percentage or label: {missing}"
 
 
 def test_multi_progress_bars():
@@ -201,6 +230,7 @@ def test_multi_progress_bars():
         assert f"{progress}%" in result
 
 
+@pytest.mark.xdist_group(name="progress_bar")
 class TestSegmentedProgressBar:
     """Test segmented progress bar functionality."""
     
@@ -304,6 +334,7 @@ class TestSegmentedProgressBar:
         assert "50%" in result
 
 
+@pytest.mark.xdist_group(name="progress_bar")
 class TestSpinnerBar:
     """Test SpinnerBar class functionality."""
     
@@ -342,30 +373,23 @@ class TestSpinnerBar:
         spinner = SpinnerBar(style="line")
         
         # Cycle through all frames
-        frames = []
-        for _ in range(len(spinner.frames)):
-            frames.append(spinner.next())
+        frames = [spinner.next() for _ in range(len(spinner.frames))]
         
-        # Should have seen all unique frames
-        # Remove ANSI codes for comparison
-        import re
-        ansi_escape = re.compile(r'\x1B(?:[@-Z\\-_]|\[[0-?]*[ -/]*[@-~])')
-        clean_frames = [ansi_escape.sub('', f) for f in frames]
+        # Should have seen all unique frames once ANSI codes are removed
+        clean_frames = _ANSI_ESCAPE.sub('', "\n".join(frames)).split("\n")
         
         assert set(clean_frames) == set(spinner.frames)
     
-    def test_spinner_styles(self):
+    @pytest.mark.parametrize("style", ["dots", "line", "circle", "bounce", "blocks"])
+    def test_spinner_styles(self, style):
         """Test different spinner styles."""
-        styles = ["dots", "line", "circle", "bounce", "blocks"]
+        spinner = SpinnerBar(style=style)
+        frame = spinner.next()
         
-        for style in styles:
-            spinner = SpinnerBar(style=style)
-            frame = spinner.next()
-            
-            # Should produce output
-            assert len(frame) > 0
-            # Should contain color codes
-            assert RESET in frame
+        # Should produce output
+        assert len(frame) > 0
+        # Should contain color codes
+        assert RESET in frame
     
     def test_spinner_invalid_style(self):
         """Test spinner with invalid style falls back to dots."""
@@ -385,30 +409,13 @@ class TestSpinnerBar:
 
 def test_demo_function(capsys):
     """Test the demo() function runs without errors."""
-    from unittest.mock import patch
-    
-    # Mock time.sleep to be instant - this avoids the 9+ second delay
-    with patch('time.sleep'):
-        from cli.components.progress_bar import demo
-        
-        # Run the demo (sleeps are mocked so it's instant)
-        demo()
+    # time.sleep is stubbed module-wide by _no_sleep, so the demo is instant
+    demo()
     
     # Capture output
     captured = capsys.readouterr()
     
-    # Check that it produced output
+    # Check that it produced every section, reporting all that are missing
     assert len(captured.out) > 0
-    assert "Storm-Checker Progress Bar Demo" in captured.out
-    assert "Basic Progress Bars:" in captured.out
-    assert "blocks" in captured.out
-    assert "dots" in captured.out
-    assert "arrows" in captured.out
-    assert "squares" in captured.out
-    assert "lines" in captured.out
-    assert "Animated Progress:" in captured.out
-    assert "Loading" in captured.out
-    assert "Segmented Progress Bar:" in captured.out
-    assert "Tutorial Progress" in captured.out
-    assert "Spinners:" in captured.out
-    assert "Custom Colors:" in captured.out
\ No newline at end of file
+    missing = [text for text in _DEMO_EXPECTED_OUTPUT if text not in captured.out]
+    assert not missing, f"demo output missing: {missing}"
@@ -0,0 +1,394 @@
+"""
+Comprehensive Tests for Rich Terminal
+====================================
+Tests for Rich library integration with BufferedRenderer and fallback support.
+"""
+
+import time
+from contextlib import nullcontext
+from types import SimpleNamespace
+
+import pytest
+from unittest.mock import DEFAULT, Mock, MagicMock, NonCallableMock, patch
+
+from storm_checker.cli.components.buffered_renderer import RenderMode
+from storm_checker.cli.components.rich_terminal import (
+    RichTerminal, ProgressTracker, FallbackProgressTracker,
+    LiveDisplay, FallbackLiveDisplay, create_rich_terminal, demo_rich_terminal
+)
+
+# console.capture() stand-in for the Rich-mode print tests. It holds no
+# per-test state, so it is built once at import time and shared.
+_SHARED_CAPTURE_STUB = MagicMock()
+_SHARED_CAPTURE_STUB.__enter__.return_value = Mock(get=Mock(return_value="out"))
+_SHARED_CAPTURE_STUB.__exit__.return_value = False
+
+
+@pytest.fixture(autouse=True, scope="module")
+def _no_sleep():
+    """Make time.sleep a no-op once for the whole module (the demo animates)."""
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(time, "sleep", lambda *_: None)
+        yield
+
+
+class TestRichTerminal:
+    """Test the RichTerminal class."""
+    
+    @pytest.fixture(scope="class")
+    def rich_terminal(self, rich_term_mock_br, mock_rich_imports):
+        """RichTerminal in Rich mode, built once for the whole class."""
+        return RichTerminal()
+    
+    @pytest.fixture
+    def captured_terminal(self, rich_terminal, monkeypatch):
+        """Rich-mode terminal whose console.capture() yields "out"."""
+        monkeypatch.setattr(rich_terminal.console.capture, "return_value", _SHARED_CAPTURE_STUB)
+        return rich_terminal
+    
+    @pytest.fixture(scope="class")
+    def fallback_terminal(self, rich_term_mock_br):
+        """RichTerminal in fallback mode, built once for the whole class."""
+        return RichTerminal(use_rich=False)
+    
+    @pytest.fixture(autouse=True)
+    def _reset_mocks(self, request):
+        """Reset the class-scoped mocks so call assertions stay per-test."""
+        for value in request.node.funcargs.values():
+            for candidate in (value.values() if isinstance(value, dict) else (value,)):
+                if isinstance(candidate, NonCallableMock):
+                    candidate.reset_mock()
+        yield
+    
+    @pytest.mark.parametrize(
+        "rich_available,use_rich_arg,expected_use_rich,expected_console_is_none",
+        [
+            (True, True, True, False),
+            (False, True, False, True),
+            (True, False, False, True),
+            (True, None, True, False),
+        ],
+        ids=["rich_available", "rich_unavailable", "rich_disabled", "defaults"],
+    )
+    def test_initialization(self, monkeypatch, rt_module, rich_term_mock_br, mock_rich_imports,
+                            rich_available, use_rich_arg, expected_use_rich,
+                            expected_console_is_none):
+        """Test RichTerminal initialization across Rich availability and use_rich."""
+        monkeypatch.setattr(rt_module, "RICH_AVAILABLE", rich_available)
+        
+        if use_rich_arg is None:
+            terminal = RichTerminal()
+        else:
+            terminal = RichTerminal(use_rich=use_rich_arg)
+        
+        assert terminal.use_rich is expected_use_rich
+        assert (terminal.console is None) is expected_console_is_none
+        assert terminal._live_context is None
+        assert terminal.buffered_renderer is rich_term_mock_br
+    
+    def test_print_with_rich(self, captured_terminal):
+        """Test print method with Rich available."""
+        captured_terminal.print("test", "message", style="bold", highlight=False, persist=True)
+        
+        captured_terminal.console.print.assert_called_once_with(
+            "test", "message",
+            style="bold",
+            highlight=False,
+            markup=True,
+            emoji=True
+        )
+        captured_terminal.buffered_renderer.render_frame.assert_called_once_with(["out"], RenderMode.APPEND)
+    
+    def test_print_with_rich_no_persist(self, captured_terminal):
+        """Test print method with Rich available but no persist."""
+        with patch('builtins.print') as mock_print:
+            captured_terminal.print("test", persist=False)
+            
+            mock_print.assert_called_once_with("out", end='')
+            captured_terminal.buffered_renderer.render_frame.assert_not_called()
+    
+    def test_print_without_rich(self, monkeypatch, rt_module):
+        """Test print method without Rich available."""
+        mock_instance = Mock()
+        monkeypatch.setattr(rt_module, "RICH_AVAILABLE", False)
+        monkeypatch.setattr(rt_module, "Console", None)
+        monkeypatch.setattr(rt_module, "BufferedRenderer", Mock(return_value=mock_instance))
+        
+        terminal = RichTerminal()
+        
+        terminal.print("test", "message", persist=True)
+        
+        mock_instance.render_persistent_message.assert_called_with("test message")
+    
+    def test_print_without_rich_no_persist(self, monkeypatch, rt_module):
+        """Test print method without Rich and no persist."""
+        mock_instance = Mock()
+        monkeypatch.setattr(rt_module, "RICH_AVAILABLE", False)
+        monkeypatch.setattr(rt_module, "Console", None)
+        monkeypatch.setattr(rt_module, "BufferedRenderer", Mock(return_value=mock_instance))
+        
+        terminal = RichTerminal()
+        
+        with patch('builtins.print') as mock_print:
+            terminal.print("test", "message", persist=False)
+            
+            mock_print.assert_called_once_with("test message")
+            mock_instance.render_persistent_message.assert_not_called()
+    
+    def test_print_panel_with_rich(self, captured_terminal, rich_stubs):
+        """Test print_panel method with Rich available."""
+        captured_terminal.print_panel(
+            "content",
+            title="Test Title",
+            subtitle="Test Subtitle"
+        )
+        
+        # Console.print should be called with the panel
+        rich_stubs["Panel"].assert_called_once()
+        captured_terminal.console.print.assert_called()
+        assert captured_terminal.console.print.call_args.args == (rich_stubs["Panel"].return_value,)
+    
+    def test_print_table_with_rich(self, captured_terminal, rich_stubs):
+        """Test print_table method with Rich available."""
+        data = [["A", "B"], ["C", "D"]]
+        headers = ["Col1", "Col2"]
+        
+        captured_terminal.print_table(data, headers=headers, title="Test Table")
+        
+        # Console.print should be called
+        rich_stubs["Table"].assert_called_once()
+        captured_terminal.console.print.assert_called()
+        assert captured_terminal.console.print.call_args.args == (rich_stubs["Table"].return_value,)
+    
+    def test_print_table_without_headers_with_rich(self, captured_terminal, rich_stubs):
+        """Test print_table method without headers with Rich available."""
+        data = [["A", "B"], ["C", "D"]]
+        
+        captured_terminal.print_table(data)
+        
+        # Console.print should be called
+        rich_stubs["Table"].assert_called_once()
+        captured_terminal.console.print.assert_called()
+        assert captured_terminal.console.print.call_args.args == (rich_stubs["Table"].return_value,)
+    
+    def test_print_markdown_with_rich(self, captured_terminal, rich_stubs):
+        """Test print_markdown method with Rich available."""
+        markdown_content = "# Header\n## Subheader"
+        
+        captured_terminal.print_markdown(markdown_content)
+        
+        # Console.print should be called
+        rich_stubs["Markdown"].assert_called_once()
+        captured_terminal.console.print.assert_called()
+        assert captured_terminal.console.print.call_args.args == (rich_stubs["Markdown"].return_value,)
+    
+    def test_print_code_with_rich(self, captured_terminal, rich_stubs):
+        """Test print_code method with Rich available."""
+        code = "def hello():\n    print('world')"
+        
+        captured_terminal.print_code(code, language="python")
+        
+        # Console.print should be called
+        rich_stubs["Syntax"].assert_called_once()
+        captured_terminal.console.print.assert_called()
+        assert captured_terminal.console.print.call_args.args == (rich_stubs["Syntax"].return_value,)
+    
+    def test_print_rule_with_rich(self, captured_terminal, rich_stubs):
+        """Test print_rule method with Rich available."""
+        captured_terminal.print_rule("Test Rule")
+        
+        # Console.print should be called
+        rich_stubs["Rule"].assert_called_once()
+        captured_terminal.console.print.assert_called()
+        assert captured_terminal.console.print.call_args.args == (rich_stubs["Rule"].return_value,)
+    
+    def test_print_tree_with_rich(self, captured_terminal, rich_stubs):
+        """Test print_tree method with Rich available."""
+        tree_data = {
+            "root": {
+                "child1": "value1",
+                "child2": {
+                    "grandchild": "value2"
+                }
+            }
+        }
+        
+        captured_terminal.print_tree(tree_data, title="Test Tree")
+        
+        # Console.print should be called
+        rich_stubs["Tree"].assert_called_once()
+        captured_terminal.console.print.assert_called()
+        assert captured_terminal.console.print.call_args.args == (rich_stubs["Tree"].return_value,)
+    
+    @pytest.mark.parametrize("method,args,kwargs,expected_calls", [
+        pytest.param("print_markdown", ("# Header\n## Subheader\n- Item\nRegular text",), {}, 4, id="markdown"),
+        pytest.param("print_code", ("def hello():\n    print('world')",), {"language": "python"}, 4, id="code"),
+        pytest.param("print_rule", ("Test Rule",), {}, 1, id="rule"),
+        pytest.param("print_rule", (), {}, 1, id="rule_no_title"),
+        pytest.param("print_tree", ({"root": {"child1": "value1", "child2": "value2"}},), {"title": "Test Tree"}, 4,
+                     id="tree"),
+        pytest.param("print_tree", ({"root": {"child1": {"grandchild1": "value1", "grandchild2": "value2"}}},), {}, 5,
+                     id="tree_recursive"),
+    ])
+    def test_fallback_renders_messages(self, fallback_terminal, method, args, kwargs, expected_calls):
+        """Test print_* fallbacks emit one persistent message per rendered line."""
+        getattr(fallback_terminal, method)(*args, **kwargs)
+        
+        assert fallback_terminal.buffered_renderer.render_persistent_message.call_count == expected_calls
+    
+    def test_progress_context_with_rich(self, rich_terminal, rich_stubs, rt_module):
+        """Test progress context manager with Rich available."""
+        mock_progress = rich_stubs["Progress"].return_value
+        mock_progress.add_task.return_value = 1
+        mock_progress.__enter__.return_value = mock_progress
+        
+        # SpinnerColumn is imported inside progress(); the other columns are
+        # module globals of rich_terminal.
+        with patch.multiple('rich.progress', SpinnerColumn=DEFAULT), \
+                patch.multiple(rt_module, TextColumn=DEFAULT, BarColumn=DEFAULT):
+            with rich_terminal.progress("Test Task", total=100) as tracker:
+                assert isinstance(tracker, ProgressTracker)
+                assert tracker.progress is mock_progress
+                assert tracker.task_id == 1
+        
+        mock_progress.add_task.assert_called_once_with("Test Task", total=100)
+    
+    def test_progress_context_without_rich(self, monkeypatch, rt_module):
+        """Test progress context manager without Rich available."""
+        monkeypatch.setattr(rt_module, "RICH_AVAILABLE", False)
+        monkeypatch.setattr(rt_module, "Console", None)
+        monkeypatch.setattr(rt_module, "BufferedRenderer", Mock(return_value=Mock()))
+        
+        terminal = RichTerminal()
+        
+        with terminal.progress("Test Task", total=100) as tracker:
+            assert isinstance(tracker, FallbackProgressTracker)
+            assert tracker.description == "Test Task"
+            assert tracker.total == 100
+    
+    def test_live_display_context_with_rich(self, rich_terminal, rich_stubs):
+        """Test live_display context manager with Rich available."""
+        mock_live = rich_stubs["Live"].return_value
+        mock_live.__enter__.return_value = mock_live
+        
+        with rich_terminal.live_display("start") as display:
+            assert isinstance(display, LiveDisplay)
+            assert display.live is mock_live
+            assert rich_terminal._live_context is mock_live
+        
+        assert rich_terminal._live_context is None
+        rich_stubs["Live"].assert_called_once_with(
+            "start", console=rich_terminal.console, refresh_per_second=4
+        )
+    
+    def test_live_display_context_without_rich(self, monkeypatch, rt_module):
+        """Test live_display context manager without Rich available."""
+        monkeypatch.setattr(rt_module, "RICH_AVAILABLE", False)
+        monkeypatch.setattr(rt_module, "Console", None)
+        monkeypatch.setattr(rt_module, "BufferedRenderer", Mock(return_value=Mock()))
+        
+        terminal = RichTerminal()
+        
+        with terminal.live_display() as display:
+            assert isinstance(display, FallbackLiveDisplay)
+            assert display.terminal is terminal
+    
+    def test_prompt_with_rich(self, rich_terminal, rich_stubs):
+        """Test prompt method with Rich available."""
+        mock_prompt = rich_stubs["Prompt"]
+        mock_prompt.ask.return_value = "user input"
+        
+        result = rich_terminal.prompt("Enter value", default="default")
+        
+        assert result == "user input"
+        mock_prompt.ask.assert_called_once_with(
+            "Enter value", default="default", choices=None, console=rich_terminal.console
+        )
+    
+    def test_confirm_with_rich(self, rich_terminal, rich_stubs):
+        """Test confirm method with Rich available."""
+        mock_confirm = rich_stubs["Confirm"]
+        mock_confirm.ask.return_value = True
+        
+        result = rich_terminal.confirm("Are you sure?", default=False)
+        
+        assert result is True
+        mock_confirm.ask.assert_called_once_with(
+            "Are you sure?", default=False, console=rich_terminal.console
+        )
+    
+    @pytest.mark.parametrize("method,input_value,kwargs,expected", [
+        ("prompt", "user_input", {"default": "d"}, "user_input"),
+        ("prompt", "", {"default": "default"}, "default"),
+        ("prompt", "", {}, ""),
+        ("confirm", "y", {"default": False}, True),
+        ("confirm", "", {"default": True}, True),
+        ("confirm", "n", {"default": True}, False),
+        ("confirm", "", {"default": False}, False),
+    ])
+    def test_prompt_confirm_fallback(self, fallback_terminal, method, input_value, kwargs, expected):
+        """Test prompt and confirm read from input() without Rich."""
+        with patch('builtins.input', return_value=input_value):
+            assert getattr(fallback_terminal, method)("Q?", **kwargs) == expected
+    
+    def test_clear_last_frame(self, rich_terminal):
+        """Test clear_last_frame method."""
+        rich_terminal.clear_last_frame()
+        
+        # Should replace the last frame with empty content
+        rich_terminal.buffered_renderer.render_frame.assert_called_once_with([], RenderMode.REPLACE_LAST)
+    
+    def test_cleanup_with_live_context(self, rich_terminal, monkeypatch):
+        """Test cleanup method with active live context."""
+        # Mock live context
+        mock_live = Mock()
+        mock_live.stop = Mock()
+        monkeypatch.setattr(rich_terminal, "_live_context", mock_live)
+        
+        rich_terminal.cleanup()
+        
+        mock_live.stop.assert_called_once()
+        rich_terminal.buffered_renderer.cleanup.assert_called_once()
+    
+    def test_cleanup_without_live_context(self, rich_terminal):
+        """Test cleanup method without active live context."""
+        rich_terminal.cleanup()
+        
+        rich_terminal.buffered_renderer.cleanup.assert_called_once()
+
+
+class TestFallbackProgressTracker:
+    """Test the FallbackProgressTracker class."""
+    
+    def test_update_default_advance(self):
+        """Test update() advances by one when no amount is given."""
+        tracker = FallbackProgressTracker(SimpleNamespace(buffered_renderer=Mock()), "Testing", 10)
+        
+        tracker.update()
+        
+        assert tracker.current == 1
+
+
+class TestConvenienceFunctions:
+    """Test convenience functions."""
+    
+    def test_create_rich_terminal(self, monkeypatch, rt_module):
+        """Test create_rich_terminal function."""
+        monkeypatch.setattr(rt_module, "BufferedRenderer", Mock())
+        
+        terminal = create_rich_terminal(use_rich=False)
+        
+        assert isinstance(terminal, RichTerminal)
+        assert terminal.use_rich is False
+    
+    def test_demo_rich_terminal(self, monkeypatch, rt_module):
+        """Test demo_rich_terminal function."""
+        mock_terminal = Mock()
+        mock_terminal.progress.return_value = nullcontext(Mock())
+        monkeypatch.setattr(rt_module, "RichTerminal", Mock(return_value=nullcontext(mock_terminal)))
+        
+        demo_rich_terminal()
+        
+        # Check that various methods were called during the demo
+        assert mock_terminal.print_rule.call_count > 0
+        mock_terminal.progress.assert_called_once_with("Processing items...", total=10)
\ No newline at end of file
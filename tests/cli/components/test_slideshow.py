@@ -5,18 +5,83 @@ Tests for the slideshow component with full coverage of all functionality.
 """
 
 import pytest
-from unittest.mock import Mock, patch, MagicMock, PropertyMock
-from pathlib import Path
-import sys
+from unittest.mock import Mock, MagicMock, PropertyMock, create_autospec
 import os
-
-# Add parent to path
-sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+from collections import namedtuple
 
 from storm_checker.cli.components.slideshow import (
     Slideshow, Slide, ContentMode
 )
-from storm_checker.cli.components.border import BorderStyle
+from storm_checker.cli.components.border import Border, BorderStyle
+from storm_checker.cli.components.progress_bar import ProgressBar
+
+
+# Fixed os.get_terminal_size() results; a namedtuple is all Slideshow reads
+_Size = namedtuple('Size', ['columns', 'lines'])
+_DEFAULT_SIZE = _Size(80, 24)
+
+# Markdown with a fenced code block, for the _format_content tests
+_CODE_BLOCK_CONTENT = '''Regular text
+```python
+def hello():
+    print("Hello")
+```
+More text'''
+
+
+def _mock_middle(*args, **kwargs):
+    """Stand-in for Border.middle that echoes the text it was given."""
+    if 'center_text' in kwargs:
+        return f"║ {kwargs.get('center_text', '')} ║"
+    elif 'left_text' in kwargs:
+        return f"║{kwargs.get('left_text', '')}║"
+    elif len(args) > 1:
+        # Handle positional arguments
+        if len(args) > 3:
+            return f"║ {args[1]} | {args[2]} | {args[3]} ║"
+        elif len(args) > 2:
+            return f"║ {args[1]} | {args[2]} ║"
+        elif len(args) > 1:
+            return f"║ {args[1]} ║"
+    return "║ TEST ║"
+
+
+def _no_terminal():
+    """Stand-in for os.get_terminal_size when there is no terminal."""
+    raise Exception("No terminal")
+
+
+# Border and ProgressBar class mocks are configured once per session; the
+# per-test fixtures in TestSlideshow only reset their call history.
+
+@pytest.fixture(scope="session")
+def _border_class():
+    """Autospecced Border class whose instance renders fixed box pieces."""
+    mock_border_class = create_autospec(Border)
+    mock_border_instance = mock_border_class.return_value
+    mock_border_instance.top.return_value = "╔══════╗"
+    mock_border_instance.middle.side_effect = _mock_middle
+    mock_border_instance.bottom.return_value = "╚══════╝"
+    mock_border_instance.horizontal_divider.return_value = "╟──────╢"
+    mock_border_instance.empty_line.return_value = "║      ║"
+    return mock_border_class
+
+
+@pytest.fixture(scope="session")
+def _progress_bar_class():
+    """Autospecced ProgressBar class whose instance renders a fixed bar."""
+    mock_pb_class = create_autospec(ProgressBar)
+    mock_pb_class.return_value.render.return_value = "[████░░] 60%"
+    return mock_pb_class
+
+
+@pytest.fixture(autouse=True, scope="module")
+def mock_terminal_size():
+    """Pin os.get_terminal_size to 80x24 once for the whole module."""
+    with pytest.MonkeyPatch.context() as mp:
+        mock_size = Mock(return_value=_DEFAULT_SIZE)
+        mp.setattr(os, "get_terminal_size", mock_size)
+        yield mock_size
 
 
 class TestSlide:
@@ -56,66 +121,35 @@ class TestSlide:
 class TestContentMode:
     """Test the ContentMode enum."""
     
-    def test_content_modes(self):
+    @pytest.mark.parametrize("mode, expected_value", [
+        (ContentMode.SLIDE, "slide"),
+        (ContentMode.QUESTION, "question"),
+        (ContentMode.RESULT, "result"),
+    ], ids=["slide", "question", "result"])
+    def test_content_modes(self, mode, expected_value):
         """Test ContentMode enum values."""
-        assert ContentMode.SLIDE.value == "slide"
-        assert ContentMode.QUESTION.value == "question"
-        assert ContentMode.RESULT.value == "result"
+        assert mode.value == expected_value
 
 
 class TestSlideshow:
     """Test the Slideshow class."""
     
     @pytest.fixture
-    def mock_border(self):
+    def mock_border(self, monkeypatch, _border_class):
         """Mock Border class."""
-        with patch('storm_checker.cli.components.slideshow.Border') as mock_border_class:
-            mock_border_instance = Mock()
-            mock_border_instance.top.return_value = "╔══════╗"
-            
-            # Mock middle method to accept different arguments properly
-            def mock_middle(*args, **kwargs):
-                if 'center_text' in kwargs:
-                    return f"║ {kwargs.get('center_text', '')} ║"
-                elif 'left_text' in kwargs:
-                    return f"║{kwargs.get('left_text', '')}║"
-                elif len(args) > 1:
-                    # Handle positional arguments
-                    if len(args) > 3:
-                        return f"║ {args[1]} | {args[2]} | {args[3]} ║"
-                    elif len(args) > 2:
-                        return f"║ {args[1]} | {args[2]} ║"
-                    elif len(args) > 1:
-                        return f"║ {args[1]} ║"
-                return "║ TEST ║"
-            
-            mock_border_instance.middle.side_effect = mock_middle
-            mock_border_instance.bottom.return_value = "╚══════╝"
-            mock_border_instance.horizontal_divider.return_value = "╟──────╢"
-            mock_border_instance.left.return_value = "║ "
-            mock_border_instance.right.return_value = " ║"
-            mock_border_instance.empty_line.return_value = "║      ║"
-            mock_border_class.return_value = mock_border_instance
-            yield mock_border_instance
+        _border_class.reset_mock()
+        monkeypatch.setattr('storm_checker.cli.components.slideshow.Border', _border_class)
+        return _border_class.return_value
     
     @pytest.fixture
-    def mock_progress_bar(self):
+    def mock_progress_bar(self, monkeypatch, _progress_bar_class):
         """Mock ProgressBar class."""
-        with patch('storm_checker.cli.components.slideshow.ProgressBar') as mock_pb_class:
-            mock_pb_instance = Mock()
-            mock_pb_instance.render.return_value = "[████░░] 60%"
-            mock_pb_class.return_value = mock_pb_instance
-            yield mock_pb_instance
+        _progress_bar_class.reset_mock()
+        monkeypatch.setattr('storm_checker.cli.components.slideshow.ProgressBar', _progress_bar_class)
+        return _progress_bar_class.return_value
     
     @pytest.fixture
-    def mock_terminal_size(self):
-        """Mock terminal size functions."""
-        with patch('os.get_terminal_size') as mock_size:
-            mock_size.return_value = Mock(columns=80, lines=24)
-            yield mock_size
-    
-    @pytest.fixture
-    def slideshow(self, mock_border, mock_progress_bar, mock_terminal_size):
+    def slideshow(self, mock_border, mock_progress_bar):
         """Create a Slideshow instance with mocked dependencies."""
         return Slideshow(
             border_style=BorderStyle.DOUBLE,
@@ -140,35 +174,33 @@ class TestSlideshow:
         assert slideshow.width == 100
         assert slideshow.height == 30
     
-    def test_get_terminal_width_success(self, slideshow):
+    def test_get_terminal_width_success(self, slideshow, monkeypatch):
         """Test _get_terminal_width with successful terminal size."""
-        with patch('os.get_terminal_size') as mock_size:
-            mock_size.return_value = Mock(columns=150)
-            width = slideshow._get_terminal_width()
-            
-            assert width == 120  # Max is 120
+        monkeypatch.setattr(os, 'get_terminal_size', Mock(return_value=_Size(150, 24)))
+        width = slideshow._get_terminal_width()
+        
+        assert width == 120  # Max is 120
     
-    def test_get_terminal_width_fallback(self, slideshow):
+    def test_get_terminal_width_fallback(self, slideshow, monkeypatch):
         """Test _get_terminal_width with exception."""
-        with patch('os.get_terminal_size', side_effect=Exception("No terminal")):
-            width = slideshow._get_terminal_width()
-            
-            assert width == 80  # Fallback value
+        monkeypatch.setattr(os, 'get_terminal_size', _no_terminal)
+        width = slideshow._get_terminal_width()
+        
+        assert width == 80  # Fallback value
     
-    def test_get_terminal_height_success(self, slideshow):
+    def test_get_terminal_height_success(self, slideshow, monkeypatch):
         """Test _get_terminal_height with successful terminal size."""
-        with patch('os.get_terminal_size') as mock_size:
-            mock_size.return_value = Mock(lines=40)
-            height = slideshow._get_terminal_height()
-            
-            assert height == 40
+        monkeypatch.setattr(os, 'get_terminal_size', Mock(return_value=_Size(80, 40)))
+        height = slideshow._get_terminal_height()
+        
+        assert height == 40
     
-    def test_get_terminal_height_fallback(self, slideshow):
+    def test_get_terminal_height_fallback(self, slideshow, monkeypatch):
         """Test _get_terminal_height with exception."""
-        with patch('os.get_terminal_size', side_effect=Exception("No terminal")):
-            height = slideshow._get_terminal_height()
-            
-            assert height == 24  # Fallback value
+        monkeypatch.setattr(os, 'get_terminal_size', _no_terminal)
+        height = slideshow._get_terminal_height()
+        
+        assert height == 24  # Fallback value
     
     def test_render_header(self, slideshow):
         """Test render_header method."""
@@ -252,8 +284,13 @@ class TestSlideshow:
         assert "Test Slide" in result
         assert "2/5" in result
     
-    def test_render_dynamic_content_slide_mode(self, slideshow):
-        """Test render_dynamic_content in SLIDE mode."""
+    @pytest.mark.parametrize("mode, content_data, expected_substr", [
+        (ContentMode.SLIDE, "Additional content", "Dynamic Slide"),
+        (ContentMode.QUESTION, "What is the answer?", "What is the answer?"),
+        (ContentMode.RESULT, "✅ Correct!", "✅ Correct!"),
+    ], ids=["slide", "question", "result"])
+    def test_render_dynamic_content(self, slideshow, mode, content_data, expected_substr):
+        """Test render_dynamic_content in each ContentMode."""
         slide = Slide(
             title="Dynamic Slide",
             content="Base content",
@@ -264,67 +301,58 @@ class TestSlideshow:
         
         result = slideshow.render_dynamic_content(
             slide,
-            mode=ContentMode.SLIDE,
-            content_data="Additional content",
+            mode=mode,
+            content_data=content_data,
             is_completed=False,
             navigation_hints="Navigation"
         )
         
         assert isinstance(result, str)
-        assert "Dynamic Slide" in result
+        assert expected_substr in result
     
-    def test_render_dynamic_content_question_mode(self, slideshow):
-        """Test render_dynamic_content in QUESTION mode."""
-        slide = Slide(
-            title="Question",
-            content="Base",
-            slide_number=1,
-            total_slides=1
-        )
-        
-        result = slideshow.render_dynamic_content(
-            slide,
-            mode=ContentMode.QUESTION,
-            content_data="What is the answer?",
-            is_completed=False
-        )
-        
-        assert isinstance(result, str)
-    
-    def test_render_dynamic_content_result_mode(self, slideshow):
-        """Test render_dynamic_content in RESULT mode."""
-        slide = Slide(
-            title="Result",
-            content="Base",
-            slide_number=1,
-            total_slides=1
-        )
-        
-        result = slideshow.render_dynamic_content(
-            slide,
-            mode=ContentMode.RESULT,
-            content_data="✅ Correct!",
-            is_completed=False
+    def test_render_completion_screen(self, slideshow):
+        """Test render_completion_screen method."""
+        result = slideshow.render_completion_screen(
+            tutorial_id="test_tutorial",
+            score=(8, 10),  # Tuple of correct/total
+            message="Great job!",
+            achievements=["Speed Demon", "Perfect Score"]
         )
         
         assert isinstance(result, str)
-    
-    def test_format_content_with_code_blocks(self, slideshow):
+        # The mocked border echoes only the header's center text, not the tutorial_id
+        # So we check for existence of key elements in the output
+        assert "8" in result or "10" in result or "80" in result  # Score display
+        assert "Great job!" in result or "GREAT JOB!" in result
+        assert "Speed Demon" in result or "SPEED DEMON" in result
+        assert "Perfect Score" in result or "PERFECT SCORE" in result
+
+
+class TestSlideshowPure:
+    """Test Slideshow's text formatting helpers, which never touch the border."""
+    
+    @pytest.fixture(scope="class")
+    def slideshow_ro(self, _border_class, _progress_bar_class):
+        """One Slideshow shared by the read-only tests in this class."""
+        with pytest.MonkeyPatch.context() as mp:
+            mp.setattr('storm_checker.cli.components.slideshow.Border', _border_class)
+            mp.setattr('storm_checker.cli.components.slideshow.ProgressBar', _progress_bar_class)
+            yield Slideshow(
+                border_style=BorderStyle.DOUBLE,
+                border_color="learn",
+                width=None,
+                height=None
+            )
+    
+    def test_format_content_with_code_blocks(self, slideshow_ro):
         """Test _format_content with code blocks."""
-        content = '''Regular text
-```python
-def hello():
-    print("Hello")
-```
-More text'''
-        
-        formatted = slideshow._format_content(content, max_lines=100)
+        formatted = slideshow_ro._format_content(_CODE_BLOCK_CONTENT, max_lines=100)
         
         assert isinstance(formatted, list)
         # Should contain formatted code block
         assert any("def hello():" in line for line in formatted)
     
-    def test_format_content_with_bullets(self, slideshow):
+    def test_format_content_with_bullets(self, slideshow_ro):
         """Test _format_content with bullet points."""
         content = """Header
 • Point 1
@@ -332,112 +360,78 @@ More text'''
 - Dash point
 * Star point"""
         
-        formatted = slideshow._format_content(content, max_lines=100)
+        formatted = slideshow_ro._format_content(content, max_lines=100)
         
         assert isinstance(formatted, list)
         # Should format bullet points
         assert any("•" in line or "▸" in line for line in formatted)
     
-    def test_format_content_with_bold(self, slideshow):
+    def test_format_content_with_bold(self, slideshow_ro):
         """Test _format_content with bold text."""
         content = "This is **bold** text and this is also **emphasized**"
         
-        formatted = slideshow._format_content(content, max_lines=100)
+        formatted = slideshow_ro._format_content(content, max_lines=100)
         
         assert isinstance(formatted, list)
         # Should contain ANSI codes for bold
     
-    def test_format_content_with_inline_code(self, slideshow):
+    def test_format_content_with_inline_code(self, slideshow_ro):
         """Test _format_content with inline code."""
         content = "Use `print()` function to display `output`"
         
-        formatted = slideshow._format_content(content, max_lines=100)
+        formatted = slideshow_ro._format_content(content, max_lines=100)
         
         assert isinstance(formatted, list)
         # Should format inline code
     
-    def test_format_heading(self, slideshow):
-        """Test _format_heading method."""
-        heading1 = slideshow._format_heading("# Main Title")
-        assert "Main Title" in heading1
-        
-        heading2 = slideshow._format_heading("## Subtitle")
-        assert "Subtitle" in heading2
-        
-        heading3 = slideshow._format_heading("### Small Heading")
-        assert "Small Heading" in heading3
-    
-    def test_format_bullet(self, slideshow):
-        """Test _format_bullet method."""
-        bullet1 = slideshow._format_bullet("• Bullet point")
-        assert "•" in bullet1 or "Bullet point" in bullet1
-        
-        bullet2 = slideshow._format_bullet("- Dash point")
-        assert "•" in bullet2 or "Dash point" in bullet2  # It converts all to bullet
-        
-        bullet3 = slideshow._format_bullet("* Star point")
-        assert "•" in bullet3 or "Star point" in bullet3
-    
-    def test_format_numbered(self, slideshow):
-        """Test _format_numbered method."""
-        num1 = slideshow._format_numbered("1. First item")
-        assert "1." in num1
-        assert "First item" in num1
-        
-        num2 = slideshow._format_numbered("2. Second item")
-        assert "2." in num2
-        assert "Second item" in num2
-    
-    def test_format_code_delimiter(self, slideshow):
-        """Test _format_code_delimiter method."""
-        delimiter1 = slideshow._format_code_delimiter("```python")
-        assert "python" in delimiter1 or "─" in delimiter1
-        
-        delimiter2 = slideshow._format_code_delimiter("```")
-        # Should contain some delimiter character
-    
-    def test_strip_ansi(self, slideshow):
+    @pytest.mark.parametrize("method_name, input_text, expected_substrs", [
+        ("_format_heading", "# Main Title", ("Main Title",)),
+        ("_format_heading", "## Subtitle", ("Subtitle",)),
+        ("_format_heading", "### Small Heading", ("Small Heading",)),
+        ("_format_bullet", "• Bullet point", ("•", "Bullet point")),
+        ("_format_bullet", "- Dash point", ("•", "Dash point")),  # It converts all to bullet
+        ("_format_bullet", "* Star point", ("•", "Star point")),
+        ("_format_numbered", "1. First item", ("1.", "First item")),
+        ("_format_numbered", "2. Second item", ("2.", "Second item")),
+        ("_format_code_delimiter", "```python", ("python",)),
+        ("_format_code_delimiter", "```", ("```",)),
+    ], ids=[
+        "heading-h1", "heading-h2", "heading-h3",
+        "bullet-dot", "bullet-dash", "bullet-star",
+        "numbered-1", "numbered-2",
+        "code-delimiter-lang", "code-delimiter-bare",
+    ])
+    def test_format_line(self, slideshow_ro, method_name, input_text, expected_substrs):
+        """Test the single-line _format_* helpers."""
+        formatted = getattr(slideshow_ro, method_name)(input_text)
+        
+        for expected in expected_substrs:
+            assert expected in formatted
+    
+    def test_strip_ansi(self, slideshow_ro):
         """Test _strip_ansi method."""
         text_with_ansi = "\033[1mBold\033[0m \033[31mRed\033[0m"
         
-        stripped = slideshow._strip_ansi(text_with_ansi)
+        stripped = slideshow_ro._strip_ansi(text_with_ansi)
         
         assert stripped == "Bold Red"
         assert "\033" not in stripped
     
-    def test_wrap_text(self, slideshow):
+    def test_wrap_text(self, slideshow_ro):
         """Test _wrap_text method."""
         long_text = "This is a very long line that needs to be wrapped because it exceeds the maximum width"
         
-        wrapped = slideshow._wrap_text(long_text, 20)
+        wrapped = slideshow_ro._wrap_text(long_text, 20)
         
         assert isinstance(wrapped, list)
-        assert all(len(slideshow._strip_ansi(line)) <= 20 for line in wrapped)
+        assert all(len(slideshow_ro._strip_ansi(line)) <= 20 for line in wrapped)
     
-    def test_wrap_text_preserves_indentation(self, slideshow):
+    def test_wrap_text_preserves_indentation(self, slideshow_ro):
         """Test _wrap_text preserves indentation."""
         indented_text = "    This is indented text"
         
-        wrapped = slideshow._wrap_text(indented_text, 30)
+        wrapped = slideshow_ro._wrap_text(indented_text, 30)
         
         # The method preserves indentation for the first line, and wraps normally
         assert isinstance(wrapped, list)
         assert len(wrapped) > 0
-    
-    def test_render_completion_screen(self, slideshow):
-        """Test render_completion_screen method."""
-        result = slideshow.render_completion_screen(
-            tutorial_id="test_tutorial",
-            score=(8, 10),  # Tuple of correct/total
-            message="Great job!",
-            achievements=["Speed Demon", "Perfect Score"]
-        )
-        
-        assert isinstance(result, str)
-        # The mocked border returns "TEST" in the header, not the actual tutorial_id
-        # So we check for existence of key elements in the output
-        assert "8" in result or "10" in result or "80" in result  # Score display
-        assert "Great job!" in result or "GREAT JOB!" in result
-        assert "Speed Demon" in result or "SPEED DEMON" in result
-        assert "Perfect Score" in result or "PERFECT SCORE" in result
-    
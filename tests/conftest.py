@@ -14,8 +14,10 @@ from dataclasses import dataclass
 from datetime import datetime
 import json
 
-# Add parent directory to path
-sys.path.insert(0, str(Path(__file__).parent.parent))
+# Add parent directory to path (once; test modules rely on this)
+_ROOT = str(Path(__file__).parent.parent)
+if _ROOT not in sys.path:
+    sys.path.insert(0, _ROOT)
 
 from storm_checker.logic.mypy_runner import MypyError, MypyResult
 from storm_checker.models.progress_models import (
@@ -94,6 +94,7 @@ def create_argument_parser() -> argparse.ArgumentParser:
   {ColorPrinter.primary('python tests/run_tests.py --dashboard')}        # Dashboard view
   {ColorPrinter.primary('python tests/run_tests.py --diagnose')}         # Run diagnostics
   {ColorPrinter.primary('python tests/run_tests.py --quick')}            # Quick mode
+  {ColorPrinter.primary('python tests/run_tests.py --quick -n auto')}    # Parallel run
         """
     )
     
@@ -157,6 +158,15 @@ def create_argument_parser() -> argparse.ArgumentParser:
         type=int,
         help="Stop after N failures (useful for quick testing)"
     )
+    parser.add_argument(
+        "-n", "--workers",
+        help="Run tests in parallel with pytest-xdist (number of workers or 'auto')"
+    )
+    parser.add_argument(
+        "--dist",
+        default="loadfile",
+        help="pytest-xdist distribution mode used with --workers (default: loadfile)"
+    )
     
     # Enhanced options for debugging
     parser.add_argument(
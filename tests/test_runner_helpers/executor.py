@@ -105,6 +105,14 @@ class TestExecutor:
         if self.args.maxfail:
             args.extend(["--maxfail", str(self.args.maxfail)])
             
+        # Parallel workers (pytest-xdist); loadfile keeps each test file on
+        # one worker so its module imports are paid once
+        if getattr(self.args, 'workers', None):
+            args.extend([
+                "-n", str(self.args.workers),
+                f"--dist={getattr(self.args, 'dist', 'loadfile')}"
+            ])
+            
         # Exclude known hanging tests unless explicitly requested
         if not getattr(self.args, 'include_hanging', False):
             exclusion_args = get_exclusion_args()